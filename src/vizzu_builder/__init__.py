@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
 
 from .chart.configurator import SelectedChartConfig, ChartConfigurator
 from .chart.generator import ChartGenerator
 from .chart.updater import ChartUpdater
 from .data.configurator import DataConfig, DataConfigurator
+from .data.memory import SessionMemory
 from .story.generator import StoryGenerator
 
 
@@ -17,12 +19,15 @@ class App:
     def __init__(self) -> None:
         self._builder_data = DataConfig()
         self._builder_config = SelectedChartConfig()
+        # spilled data is loaded back before any of it is used
+        self._memory = SessionMemory()
 
         self._init_page()
         self._add_data_configurator()
         self._add_chart_configurator()
         self._add_chart_updater()
         self._add_generators()
+        self._add_memory_usage()
 
     def _init_page(self) -> None:
         st.set_page_config(page_title="Vizzu Builder", page_icon="🏗️", layout="wide")
@@ -65,3 +70,25 @@ class App:
         story_generator = StoryGenerator()
         ChartGenerator(story_generator)
         story_generator.play()
+
+    def _add_memory_usage(self) -> None:
+        self._memory.register()
+        usage = self._memory.get_usage()
+        with st.expander("Memory Usage"):
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "Key": list(usage.keys),
+                        "MB": [size / 1024**2 for size in usage.keys.values()],
+                    }
+                ),
+                hide_index=True,
+            )
+            st.caption(
+                f"{usage.sessions} sessions hold "
+                f"{usage.unique_bytes / 1024**2:.2f} MB, "
+                f"{usage.total_bytes / 1024**2:.2f} MB without sharing "
+                "identical frames. "
+                f"{usage.spilled_sessions} idle sessions are spilled to disk "
+                f"({usage.spilled_bytes / 1024**2:.2f} MB)."
+            )
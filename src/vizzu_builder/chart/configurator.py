@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-import pandas as pd
+from dataclasses import dataclass, field, replace
 import streamlit as st
 
 from ..config.unset import UNSET
 from ..data.configurator import DataConfig
 from ..data.parser import DataParser
+from ..data.schema import DataSchema
 
 
 @dataclass
 class ChartConfig:
-    df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    schema: DataSchema = field(default_factory=DataSchema)
     dimensions: list[str] = field(default_factory=list)
     measures: list[str] = field(default_factory=list)
     keys: list[str] = field(
@@ -32,27 +32,54 @@ class ChartConfig:
             "Mean",
         ]
     )
+    resolutions: list[str] = field(
+        default_factory=lambda: [
+            "Day",
+            "Week",
+            "Month",
+            "Quarter",
+            "Year",
+        ]
+    )
 
     def __post_init__(self) -> None:
         self._set_dimensions_and_measures()
 
     def _set_dimensions_and_measures(self) -> None:
-        if not self.df.empty:
-            for column_name in self.df.columns:
-                if self.df[column_name].dtype == object:
-                    self.dimensions.append(column_name)
-                else:
-                    self.measures.append(column_name)
+        self.dimensions += self.schema.dimensions
+        self.measures += self.schema.measures
 
 
 @dataclass
 class SelectedChartConfig:
+    # pylint: disable=too-many-instance-attributes
     dimensions: list[str] = field(default_factory=list)
     measures: list[str] = field(default_factory=list)
     sort: bool = False
     aggregators: list[str] = field(default_factory=list)
     label: str = UNSET
     tooltip: bool = True
+    marker_budget: int = 5000
+    top_n: int = 0
+    resolution: str = UNSET
+
+    @property
+    def columns(self) -> list[str]:
+        return [
+            column
+            for column in self.dimensions + self.measures + [self.label]
+            if column != UNSET
+        ]
+
+    def rename(self, names: dict[str, str]) -> SelectedChartConfig:
+        # derived dimensions replace their source dimensions in the charts
+        return replace(
+            self,
+            dimensions=[
+                names.get(dimension, dimension) for dimension in self.dimensions
+            ],
+            label=names.get(self.label, self.label),
+        )
 
 
 class ChartConfigurator:
@@ -63,7 +90,7 @@ class ChartConfigurator:
         if data is None or data.df.empty:
             return
         self._container = st.container()
-        self._config = ChartConfig(data.df)
+        self._config = ChartConfig(data.schema)
         self._add_title()
         self._add_buttons()
 
@@ -85,10 +112,18 @@ class ChartConfigurator:
 
     def _add_buttons(self) -> None:
         add_methods = [
-            [self._add_dimension_button],
+            [
+                self._add_dimension_button,
+                self._add_top_n_button,
+                self._add_resolution_button,
+            ],
             [self._add_measure_button, self._add_sort_button],
             [self._add_aggregator_buttons],
-            [self._add_label_button, self._add_tooltip_button],
+            [
+                self._add_label_button,
+                self._add_tooltip_button,
+                self._add_marker_budget_button,
+            ],
         ]
         column_number = len(add_methods)
         columns = self._container.columns(column_number)
@@ -101,16 +136,33 @@ class ChartConfigurator:
         self._selected_config.dimensions = st.multiselect(
             "Categories",
             self._config.dimensions,
-            max_selections=2,
-            placeholder="Select up to 2",
+            placeholder="Select categories",
+        )
+
+    def _add_top_n_button(self) -> None:
+        self._selected_config.top_n = st.number_input(  # type: ignore
+            "Top categories (0 for all)",
+            min_value=0,
+            value=SelectedChartConfig.top_n,
+            help="The other categories are merged, ranked by the first value.",
+        )
+
+    def _add_resolution_button(self) -> None:
+        disabled = not set(self._selected_config.dimensions) & set(
+            self._config.schema.datetimes
+        )
+        self._selected_config.resolution = st.selectbox(  # type: ignore
+            "Time resolution",
+            [UNSET] if disabled else [UNSET] + self._config.resolutions,
+            disabled=disabled,
+            help="Dates are grouped into periods before the charts are drawn.",
         )
 
     def _add_measure_button(self) -> None:
         self._selected_config.measures = st.multiselect(
             "Values",
             self._config.measures + ["Count"],
-            max_selections=2,
-            placeholder="Select up to 2",
+            placeholder="Select values",
         )
 
     def _add_sort_button(self) -> None:
@@ -123,7 +175,7 @@ class ChartConfigurator:
         )
 
     def _add_aggregator_buttons(self) -> None:
-        for index in range(2):
+        for index in range(max(2, len(self._selected_config.measures))):
             self._add_aggregator_button(index)
 
     def _add_aggregator_button(self, index: int) -> None:
@@ -149,3 +201,12 @@ class ChartConfigurator:
 
     def _add_tooltip_button(self) -> None:
         self._selected_config.tooltip = st.toggle("Show tooltips", value=True)
+
+    def _add_marker_budget_button(self) -> None:
+        self._selected_config.marker_budget = st.number_input(  # type: ignore
+            "Marker budget",
+            min_value=1,
+            value=SelectedChartConfig.marker_budget,
+            step=1000,
+            help="Charts that would draw more markers are not shown.",
+        )
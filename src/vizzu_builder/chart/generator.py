@@ -1,65 +1,115 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 
-import black
+import math
+
 import streamlit as st
 
 import streamlit_vizzu  # type: ignore
 
+from ..config.formatter import CodeFormatter
 from ..config.presets import Preset, Presets
+from ..data.aggregator import DataAggregator
+from ..data.bucketer import DataBucketer
 from ..data.generator import DataGenerator
+from ..data.payload import DataPayload
 from ..data.parser import DataParser
+from ..data.resampler import DataResampler
 from ..story.generator import StoryGenerator
 
 
 class ChartGenerator:
     # pylint: disable=too-few-public-methods
 
+    PAGE_SIZES: list[int] = [3, 6, 9, 12, 24]
+    PAGE_SIZE: int = 6
+
     def __init__(self, story_generator: StoryGenerator) -> None:
         self._data = st.session_state.get("BuilderData", None)
         self._config = st.session_state.get("BuilderConfig", None)
         self._story_generator = story_generator
+        self._aggregated = False
 
         if self._data is not None and self._config is not None:
             self._add_charts()
 
     def _add_charts(self) -> None:
-        presets = Presets(self._config)
+        self._bucketer = DataBucketer(self._data, self._config)
+        self._resampler = DataResampler(self._data, self._bucketer.config)
+        presets = Presets(self._resampler.config, self._get_cardinalities())
         charts = presets.charts
         self._add_title()
-        if not charts:
+        if presets.pruned:
+            st.caption(
+                f"{presets.pruned} charts are hidden, because they would draw more "
+                f"than {self._config.marker_budget:,} markers."
+            )
+        if not charts and not presets.pruned:
             st.warning(
                 f"Please select at least one {DataParser.DIMENSION} and one {DataParser.MEASURE}",
                 icon="⚠️",
             )
-        else:
-            data = streamlit_vizzu.Data()
-            data.add_df(self._data.df)
-            data.set_filter(self._data.filters)
+        elif charts:
+            data = self._get_data()
             colors = self._story_generator.story.colors
-            for index in range(0, len(charts), 3):
+            # palettes are assigned in preset order, so every preset is created
+            presets_list = [
+                Preset(data, colors, chart, index) for index, chart in enumerate(charts)
+            ]
+            page = self._add_pagination(charts)
+            for index in range(page.start, page.stop, 3):
                 col0, col1, col2 = st.columns(3)
 
                 index0 = index
                 with col0:
-                    preset0 = Preset(data, colors, charts[index0], index0)
-                    self._add_chart(preset0)
+                    self._add_chart(presets_list[index0])
 
                 index1 = index + 1
-                if index1 < len(charts):
+                if index1 < page.stop:
                     with col1:
-                        preset1 = Preset(data, colors, charts[index1], index1)
-                        self._add_chart(preset1)
+                        self._add_chart(presets_list[index1])
 
                 index2 = index + 2
-                if index2 < len(charts):
+                if index2 < page.stop:
                     with col2:
-                        preset2 = Preset(data, colors, charts[index2], index2)
-                        self._add_chart(preset2)
+                        self._add_chart(presets_list[index2])
         st.divider()
 
+    def _get_cardinalities(self) -> dict[str, int]:
+        cardinalities = {
+            dimension: max(self._data.stats.get(dimension).nunique, 1)
+            for dimension in self._config.dimensions
+        }
+        for bucket in self._bucketer.buckets.values():
+            # the top categories and the other bucket
+            cardinalities[bucket.name] = bucket.top_n + 1
+        for resample in self._resampler.resamples.values():
+            cardinalities[resample.name] = self._resampler.get_cardinality(resample)
+        return cardinalities
+
+    def _get_data(self) -> DataPayload:
+        aggregator = DataAggregator(
+            self._data, self._config, self._bucketer.groups, self._resampler.groups
+        )
+        self._aggregated = aggregator.aggregated
+        return DataPayload(aggregator.df)
+
     def _add_title(self) -> None:
         st.subheader("Charts")
 
+    def _add_pagination(self, charts: list) -> range:
+        col0, col1 = st.columns([1, 4])
+        page_size: int = col0.selectbox(  # type: ignore
+            "Charts per page",
+            self.PAGE_SIZES,
+            index=self.PAGE_SIZES.index(self.PAGE_SIZE),
+        )
+        page_count = max(math.ceil(len(charts) / page_size), 1)
+        # the labels are unique, so the selected one gives the page index
+        pages = [f"Page {page + 1} of {page_count}" for page in range(page_count)]
+        page = pages.index(col1.selectbox("Page", pages))  # type: ignore
+        page_start = page * page_size
+        return range(page_start, min(page_start + page_size, len(charts)))
+
     def _add_chart(self, preset: Preset) -> None:
         self._add_chart_title(preset)
         self._add_chart_animation(preset)
@@ -76,21 +126,30 @@ class ChartGenerator:
             key=f"chart_{preset_type}_{preset.index}",
             use_container_width=True,
         )
+        config = preset.aggregated_config if self._aggregated else preset.config
+        # the data is sent with every chart, only its serialization is shared
         chart.animate(
             preset.data,
-            streamlit_vizzu.Config(preset.config),
+            streamlit_vizzu.Config(config),
             streamlit_vizzu.Style(preset.style),
         )
         chart.feature("tooltip", self._config.tooltip)
         chart.show()
 
     def _add_chart_code(self, preset: Preset) -> None:
-        show_code = st.expander("Show Code")
-        with show_code:
+        preset_type = f"d{len(self._config.dimensions)}m{len(self._config.measures)}"
+        # the code is only generated and formatted when it is shown
+        show_code = st.toggle("Show Code", key=f"code_{preset_type}_{preset.index}")
+        if show_code:
             code = []
             code.append("from streamlit_vizzu import VizzuChart, Data, Config, Style")
             code.append("import pandas as pd")
-            code += DataGenerator.get(self._data)
+            code += DataGenerator.get(
+                self._data,
+                self._data.get_columns(self._config.columns),
+                list(self._bucketer.buckets.values()),
+                list(self._resampler.resamples.values()),
+            )
             code.append("chart = VizzuChart()")
             if self._config.tooltip:
                 code.append('chart.feature("tooltip", True)')
@@ -100,7 +159,7 @@ class ChartGenerator:
             code.append(f"chart.animate({animation})\n")
             code.append("chart.show()")
             unformatted_code = "\n".join(code)
-            formatted_code = black.format_str(unformatted_code, mode=black.FileMode())
+            formatted_code = CodeFormatter.format(unformatted_code)
             st.code(
                 formatted_code,
                 language="python",
@@ -0,0 +1,18 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import black
+
+
+class CodeFormatter:
+    # pylint: disable=too-few-public-methods
+
+    MAX_SIZE: int = 512
+
+    @staticmethod
+    @lru_cache(maxsize=MAX_SIZE)
+    def format(code: str) -> str:
+        return black.format_str(code, mode=black.FileMode())
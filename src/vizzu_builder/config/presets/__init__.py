@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+import math
+
 import streamlit as st
 import streamlit_vizzu  # type: ignore
 
-from .d1m1 import D1M1
-from .d1m2 import D1M2
-from .d2m1 import D2M1
-from .d2m2 import D2M2
 from .palettes import DEFAULT, PALETTES
+from .loader import PresetLoader
+from .registry import PresetRegistry, ResolvedPreset
 from ..unset import UNSET
 from ...data.parser import DataParser
 from ...chart.configurator import SelectedChartConfig
 
 
 class Preset:
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
     def __init__(
         self,
@@ -31,97 +32,169 @@ class Preset:
         self.types: dict = preset["types"]
         self.chart: str = preset["chart"]
         self.config: dict = preset["config"]
+        self.aggregated_config: dict = preset["aggregated_config"]
         self.style: dict = preset["style"]
         self._set_color_palette()
 
     def _set_color_palette(self) -> None:
         color = self.config["color"]
         if color is None or self.types[color] != DataParser.DIMENSION:
-            self.style["plot"]["marker"]["colorPalette"] = DEFAULT
+            palette = DEFAULT
         else:
             if color not in self._colors:
                 self._colors[color] = len(self._colors) % len(PALETTES)
-            self.style["plot"]["marker"]["colorPalette"] = " ".join(
-                PALETTES[self._colors[color]]
-            )
+            palette = " ".join(PALETTES[self._colors[color]])
+        # presets are shared between reruns, only the changed branch is copied
+        plot = self.style["plot"]
+        marker = {**plot["marker"], "colorPalette": palette}
+        self.style = {**self.style, "plot": {**plot, "marker": marker}}
 
 
 class Presets:
     # pylint: disable=too-few-public-methods
 
+    CHANNELS: list[str] = ["x", "y", "color", "lightness", "size", "noop", "label"]
+    COLOR_CHANNELS: list[str] = ["color", "lightness"]
+    MAX_COLORS: int = 20
+    MAX_POLAR_MARKERS: int = 100
+
     def __init__(
         self,
         config: SelectedChartConfig,
+        cardinalities: dict[str, int] | None = None,
     ) -> None:
         self._config = config
-        self._charts: list = []
-        self._set_charts()
+        self._pruned = 0
+        self._charts: list = list(
+            Presets._get_charts(
+                tuple(config.dimensions),
+                tuple(config.measures),
+                tuple(config.aggregators),
+                config.label,
+                config.sort,
+            )
+        )
+        if cardinalities is not None:
+            self._rank_charts(cardinalities)
 
     @property
     def charts(self) -> list:
         return self._charts
 
-    def _set_charts(self) -> None:
-        if len(self._config.dimensions) == 1 and len(self._config.measures) == 1:
-            dimension1 = self._config.dimensions[0]
-            measure1 = Presets._set_aggregator(
-                self._config.measures[0], self._config.aggregators[0]
-            )
-            self._charts = D1M1.get(dimension1, measure1)
-        elif len(self._config.dimensions) == 1 and len(self._config.measures) == 2:
-            dimension1 = self._config.dimensions[0]
-            measure1 = Presets._set_aggregator(
-                self._config.measures[0], self._config.aggregators[0]
-            )
-            measure2 = Presets._set_aggregator(
-                self._config.measures[1], self._config.aggregators[1]
-            )
-            self._charts = D1M2.get(dimension1, measure1, measure2)
-        elif len(self._config.dimensions) == 2 and len(self._config.measures) == 1:
-            dimension1 = self._config.dimensions[0]
-            dimension2 = self._config.dimensions[1]
-            measure1 = Presets._set_aggregator(
-                self._config.measures[0], self._config.aggregators[0]
-            )
-            self._charts = D2M1.get(dimension1, dimension2, measure1)
-        elif len(self._config.dimensions) == 2 and len(self._config.measures) == 2:
-            dimension1 = self._config.dimensions[0]
-            dimension2 = self._config.dimensions[1]
-            measure1 = Presets._set_aggregator(
-                self._config.measures[0], self._config.aggregators[0]
-            )
-            measure2 = Presets._set_aggregator(
-                self._config.measures[1], self._config.aggregators[1]
-            )
-            self._charts = D2M2.get(dimension1, dimension2, measure1, measure2)
-
-        self._set_labels()
-        self._set_sorts()
-
-    def _set_labels(self) -> None:
-        label = self._get_label()
-        for index, _ in enumerate(self._charts):
-            self._charts[index]["config"]["label"] = label
-
-    def _get_label(self) -> str | None:
-        new_label: str | None = self._config.label
-        if new_label == UNSET:
-            new_label = None
-        elif len(self._config.measures) > 0 and new_label == self._config.measures[0]:
-            new_label = Presets._set_aggregator(new_label, self._config.aggregators[0])
-        elif len(self._config.measures) > 1 and new_label == self._config.measures[1]:
-            new_label = Presets._set_aggregator(new_label, self._config.aggregators[1])
-        return new_label
-
-    def _set_sorts(self) -> None:
-        sort = self._get_sort()
-        for index, _ in enumerate(self._charts):
-            self._charts[index]["config"]["sort"] = sort
-
-    def _get_sort(self) -> str:
-        if self._config.sort:
-            return "byValue"
-        return "none"
+    @property
+    def pruned(self) -> int:
+        return self._pruned
+
+    def _rank_charts(self, cardinalities: dict[str, int]) -> None:
+        # charts over the marker budget are dropped, crowded ones are demoted
+        ranked = []
+        for rank, chart in enumerate(self._charts):
+            markers = Presets._get_markers(chart["config"], cardinalities)
+            if markers > self._config.marker_budget:
+                self._pruned += 1
+                continue
+            crowded = Presets._is_crowded(chart["config"], markers, cardinalities)
+            ranked.append((crowded, rank, chart))
+        ranked.sort(key=lambda item: item[:2])
+        self._charts = [chart for _, _, chart in ranked]
+
+    @staticmethod
+    def _get_markers(config: dict, cardinalities: dict[str, int]) -> int:
+        # every combination of the shown dimensions is a marker at most
+        dimensions = {
+            series
+            for channel in Presets.CHANNELS
+            for series in Presets._get_series(config[channel])
+            if series in cardinalities
+        }
+        return math.prod(cardinalities[dimension] for dimension in dimensions)
+
+    @staticmethod
+    def _is_crowded(config: dict, markers: int, cardinalities: dict[str, int]) -> bool:
+        if config["coordSystem"] == "polar" and markers > Presets.MAX_POLAR_MARKERS:
+            return True
+        return any(
+            cardinalities.get(series, 0) > Presets.MAX_COLORS
+            for channel in Presets.COLOR_CHANNELS
+            for series in Presets._get_series(config[channel])
+        )
+
+    @staticmethod
+    def _get_series(channel: str | list[str] | dict | None) -> list[str]:
+        if isinstance(channel, dict):
+            channel = channel["set"]
+        if isinstance(channel, str):
+            return [channel]
+        if isinstance(channel, list):
+            return channel
+        return []
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_charts(
+        dimensions: tuple[str, ...],
+        measures: tuple[str, ...],
+        aggregators: tuple[str, ...],
+        label: str,
+        sort: bool,
+    ) -> tuple[dict, ...]:
+        # the returned charts are shared, they must not be modified
+        series = {
+            Presets._set_aggregator(measure, aggregator): measure
+            for measure, aggregator in zip(measures, aggregators)
+        }
+        new_label = Presets._get_label(label, measures, aggregators)
+        return tuple(
+            Presets._get_chart(preset, dimensions, series, new_label, sort)
+            for preset in PresetRegistry.resolve(len(dimensions), len(measures))
+        )
+
+    @staticmethod
+    def _get_chart(
+        preset: ResolvedPreset,
+        dimensions: tuple[str, ...],
+        series: dict[str, str],
+        label: str | None,
+        sort: bool,
+    ) -> dict:
+        names = list(series)
+        measures = list(series.values())
+        placeholders = dict(zip(preset.dimensions, dimensions))
+        aggregated_placeholders = dict(placeholders)
+        for placeholder, index in preset.measures:
+            placeholders[placeholder] = names[index]
+            aggregated_placeholders[placeholder] = measures[index]
+        config = PresetLoader.substitute(preset.template["config"], placeholders)
+        config["label"] = label
+        config["sort"] = "byValue" if sort else "none"
+        aggregated_config = PresetLoader.substitute(
+            preset.template["config"], aggregated_placeholders
+        )
+        aggregated_config["label"] = None if label is None else series.get(label, label)
+        aggregated_config["sort"] = config["sort"]
+        chart = preset.template["chart"]
+        if len(preset.measures) < len(measures):
+            # charts of different measure combinations need distinct names
+            shown = ", ".join(measures[index] for _, index in preset.measures)
+            chart = f"{chart} ({shown})"
+        return {
+            "config": config,
+            "aggregated_config": aggregated_config,
+            "style": preset.template["style"],
+            "chart": chart,
+            "types": PresetLoader.substitute(preset.template["types"], placeholders),
+        }
+
+    @staticmethod
+    def _get_label(
+        label: str, measures: tuple[str, ...], aggregators: tuple[str, ...]
+    ) -> str | None:
+        if label == UNSET:
+            return None
+        if label in measures:
+            index = measures.index(label)
+            return Presets._set_aggregator(label, aggregators[index])
+        return label
 
     @staticmethod
     def _set_aggregator(measure: str, aggregator: str) -> str:
@@ -0,0 +1,137 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from functools import lru_cache
+import json
+from pathlib import Path
+from typing import Union
+
+from ...data.parser import DataParser
+
+# the values of the parsed preset files
+Json = Union[dict, list, str, int, float, bool, None]
+
+
+class PresetLoader:
+    PATH: Path = Path(__file__).parent
+    BASE: str = "base"
+    DEFAULT_STYLE: str = "default"
+    PLACEHOLDER: str = "$"
+
+    @staticmethod
+    def get(name: str, parameters: dict[str, str]) -> list[dict]:
+        # every call returns new dicts, the compiled presets are never modified
+        placeholders = {
+            f"{PresetLoader.PLACEHOLDER}{parameter}": value
+            for parameter, value in parameters.items()
+        }
+        return [
+            PresetLoader.substitute(chart, placeholders)
+            for chart in PresetLoader.load(name)
+        ]
+
+    @staticmethod
+    def substitute(value: dict, placeholders: dict[str, str]) -> dict:
+        return {
+            PresetLoader._substitute(key, placeholders): PresetLoader._substitute(
+                item, placeholders
+            )
+            for key, item in value.items()
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load(name: str) -> tuple[dict, ...]:
+        base = PresetLoader._read(PresetLoader.BASE)
+        presets = PresetLoader._read(name)
+        types = {
+            f"{PresetLoader.PLACEHOLDER}{dimension}": DataParser.DIMENSION
+            for dimension in presets["dimensions"]
+        }
+        types.update(
+            {
+                f"{PresetLoader.PLACEHOLDER}{measure}": DataParser.MEASURE
+                for measure in presets["measures"]
+            }
+        )
+        charts = []
+        for chart in presets["charts"]:
+            PresetLoader._validate(name, chart, base, types)
+            style = chart.get("style", PresetLoader.DEFAULT_STYLE)
+            charts.append(
+                {
+                    "config": {**base["config"], **chart["config"]},
+                    "style": PresetLoader._get_style(base["styles"], style),
+                    "chart": chart["chart"],
+                    "types": types,
+                }
+            )
+        return tuple(charts)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read(name: str) -> dict:
+        with (PresetLoader.PATH / f"{name}.json").open(encoding="utf-8") as file:
+            presets: dict = json.load(file)
+        return presets
+
+    @staticmethod
+    def _validate(name: str, chart: dict, base: dict, types: dict[str, str]) -> None:
+        if not isinstance(chart.get("chart"), str) or not isinstance(
+            chart.get("config"), dict
+        ):
+            raise ValueError(f"{name}: every chart needs a chart name and a config")
+        unknown = set(chart["config"]) - set(base["config"])
+        if unknown:
+            raise ValueError(f"{name}: {chart['chart']}: unknown channels {unknown}")
+        style = chart.get("style", PresetLoader.DEFAULT_STYLE)
+        if style not in base["styles"]:
+            raise ValueError(f"{name}: {chart['chart']}: unknown style {style}")
+        for series in PresetLoader._get_series(chart["config"]):
+            if series.startswith(PresetLoader.PLACEHOLDER) and series not in types:
+                raise ValueError(f"{name}: {chart['chart']}: unknown series {series}")
+
+    @staticmethod
+    def _substitute(value: Json, placeholders: dict[str, str]) -> Json:
+        if isinstance(value, dict):
+            return PresetLoader.substitute(value, placeholders)
+        if isinstance(value, list):
+            return [PresetLoader._substitute(item, placeholders) for item in value]
+        if isinstance(value, str):
+            return placeholders.get(value, value)
+        return value
+
+    @staticmethod
+    def _get_series(value: Json) -> list[str]:
+        if isinstance(value, dict):
+            return [
+                series
+                for item in value.values()
+                for series in PresetLoader._get_series(item)
+            ]
+        if isinstance(value, list):
+            return [
+                series for item in value for series in PresetLoader._get_series(item)
+            ]
+        if isinstance(value, str):
+            return [value]
+        return []
+
+    @staticmethod
+    def _get_style(styles: dict, name: str) -> dict:
+        style = dict(styles[name])
+        parent = style.pop("extends", None)
+        if parent is None:
+            return style
+        return PresetLoader._merge(PresetLoader._get_style(styles, parent), style)
+
+    @staticmethod
+    def _merge(base: dict, override: dict) -> dict:
+        merged = dict(base)
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = PresetLoader._merge(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
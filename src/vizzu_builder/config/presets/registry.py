@@ -0,0 +1,154 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+import json
+
+from .loader import PresetLoader
+from ...data.parser import DataParser
+
+
+@dataclass(frozen=True)
+class ResolvedPreset:
+    template: dict
+    dimensions: tuple[str, ...]
+    measures: tuple[tuple[str, int], ...]
+
+
+class PresetRegistry:
+    AXES: list[str] = ["x", "y"]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_index() -> dict[tuple[int, int], list[dict]]:
+        # every preset file is compiled once and indexed by the number of
+        # dimensions and measures its charts need
+        index: dict[tuple[int, int], list[dict]] = {}
+        for path in sorted(PresetLoader.PATH.glob("*.json")):
+            if path.stem == PresetLoader.BASE:
+                continue
+            for template in PresetLoader.load(path.stem):
+                types = list(template["types"].values())
+                shape = (
+                    types.count(DataParser.DIMENSION),
+                    types.count(DataParser.MEASURE),
+                )
+                index.setdefault(shape, []).append(template)
+        return index
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def resolve(dimension_count: int, measure_count: int) -> tuple[ResolvedPreset, ...]:
+        index = PresetRegistry.get_index()
+        resolved = []
+        keys_seen: set[tuple] = set()
+        # templates are ranked by their shape, the measure combination they
+        # show, then by their order in the preset file
+        for shape in PresetRegistry._get_shapes(dimension_count, measure_count):
+            for measure_indices in combinations(range(measure_count), shape[1]):
+                for template in index[shape]:
+                    preset = PresetRegistry._resolve_template(
+                        template, dimension_count, measure_indices
+                    )
+                    if preset is None:
+                        continue
+                    # different templates can end up with the same chart, and
+                    # a chart of a smaller shape is left out for the same chart
+                    # of a larger one
+                    keys = {
+                        (
+                            json.dumps(preset.template["config"], sort_keys=True),
+                            preset.measures,
+                        ),
+                        (preset.template["chart"], preset.measures),
+                    }
+                    if keys_seen.isdisjoint(keys):
+                        keys_seen.update(keys)
+                        resolved.append(preset)
+        return tuple(resolved)
+
+    @staticmethod
+    def _get_shapes(dimension_count: int, measure_count: int) -> list[tuple[int, int]]:
+        # a matching shape is used alone, otherwise every smaller shape that
+        # fits, extra dimensions are drilled down, extra measures are combined
+        index = PresetRegistry.get_index()
+        if (dimension_count, measure_count) in index:
+            return [(dimension_count, measure_count)]
+        return sorted(
+            (
+                (dimensions, measures)
+                for dimensions, measures in index
+                if 0 < dimensions <= dimension_count and 0 < measures <= measure_count
+            ),
+            reverse=True,
+        )
+
+    @staticmethod
+    def _resolve_template(
+        template: dict, dimension_count: int, measure_indices: tuple[int, ...]
+    ) -> ResolvedPreset | None:
+        dimensions = [
+            placeholder
+            for placeholder, series_type in template["types"].items()
+            if series_type == DataParser.DIMENSION
+        ]
+        measures = [
+            placeholder
+            for placeholder, series_type in template["types"].items()
+            if series_type == DataParser.MEASURE
+        ]
+        extra_dimensions = [
+            f"{PresetLoader.PLACEHOLDER}dimension{index + 1}"
+            for index in range(len(dimensions), dimension_count)
+        ]
+        drilled_template: dict | None = template
+        if extra_dimensions:
+            drilled_template = PresetRegistry._drill_down(
+                template, dimensions[-1], extra_dimensions
+            )
+        if drilled_template is None:
+            return None
+        return ResolvedPreset(
+            template=drilled_template,
+            dimensions=tuple(dimensions + extra_dimensions),
+            measures=tuple(zip(measures, measure_indices)),
+        )
+
+    @staticmethod
+    def _drill_down(
+        template: dict, dimension: str, extra_dimensions: list[str]
+    ) -> dict | None:
+        # extra dimensions follow the last dimension on the axes, so its
+        # markers are split further
+        config = dict(template["config"])
+        drilled = False
+        for axis in PresetRegistry.AXES:
+            channel = config[axis]
+            series = channel["set"] if isinstance(channel, dict) else channel
+            if series == dimension:
+                series = [dimension]
+            if not isinstance(series, list) or dimension not in series:
+                continue
+            position = series.index(dimension) + 1
+            series = series[:position] + extra_dimensions + series[position:]
+            config[axis] = (
+                {**channel, "set": series} if isinstance(channel, dict) else series
+            )
+            drilled = True
+        if not drilled:
+            # without an axis the extra dimensions split the markers by color,
+            # or they are only kept apart
+            noop = config["noop"]
+            if config["color"] is None and len(extra_dimensions) == 1:
+                config["color"] = extra_dimensions[0]
+            elif noop is None or isinstance(noop, (str, list)):
+                noop = [] if noop is None else [noop] if isinstance(noop, str) else noop
+                config["noop"] = noop + extra_dimensions
+            else:
+                return None
+        types = dict(template["types"])
+        types.update(dict.fromkeys(extra_dimensions, DataParser.DIMENSION))
+        return {**template, "config": config, "types": types}
@@ -0,0 +1,144 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from .configurator import DataConfig
+from .parser import DataParser
+from .resampler import DataResampler
+from ..chart.configurator import SelectedChartConfig
+from ..config.unset import UNSET
+
+
+class DataAggregator:
+    # pylint: disable=too-few-public-methods
+
+    COUNT: str = "Count"
+    OTHER: str = "Other"
+    AGGREGATORS: dict[str, str] = {
+        UNSET: "sum",
+        "Sum": "sum",
+        "Min": "min",
+        "Max": "max",
+        "Mean": "mean",
+    }
+
+    def __init__(
+        self,
+        data: DataConfig,
+        config: SelectedChartConfig,
+        groups: dict[str, tuple[str, tuple]] | None = None,
+        resamples: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        self._df: pd.DataFrame = data.filtered_df
+        self._aggregated: bool = False
+        # bucketed dimensions are grouped under a new name by their top values
+        self._groups = groups or {}
+        # resampled dimensions are grouped under a new name by their periods
+        self._resamples = resamples or {}
+
+        if config.dimensions and config.measures:
+            self._set_aggregated_df(data, config)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @property
+    def aggregated(self) -> bool:
+        return self._aggregated
+
+    def _set_aggregated_df(self, data: DataConfig, config: SelectedChartConfig) -> None:
+        key = (
+            "aggregated",
+            data.fingerprint,
+            data.filters,
+            tuple(config.dimensions),
+            tuple(config.measures),
+            tuple(config.aggregators),
+            tuple(self._groups.items()),
+            tuple(self._resamples.items()),
+        )
+        df = DataParser.CACHE.get(key)
+        if df is None:
+            df = self._aggregate(config)
+            DataParser.CACHE.set(key, df)
+        self._df = df
+        self._aggregated = True
+
+    def _aggregate(self, config: SelectedChartConfig) -> pd.DataFrame:
+        df = self._df
+        upcast = {
+            measure: "float64"
+            for measure in config.measures
+            if measure in df.columns and df[measure].dtype == np.float32
+        }
+        if upcast:
+            # downcast measures are aggregated in full precision
+            selected = dict.fromkeys(config.dimensions + config.measures)
+            df = df[[column for column in selected if column in df.columns]]
+            df = df.astype(upcast)
+        keys = [self._get_key(df, dimension) for dimension in config.dimensions]
+        grouped = df.groupby(keys, sort=False, dropna=False, observed=True)
+        columns: dict[str, pd.Series] = {}
+        for measure, aggregator in zip(config.measures, config.aggregators):
+            if measure == DataAggregator.COUNT:
+                columns[measure] = grouped.size()
+            else:
+                columns[measure] = grouped[measure].agg(
+                    DataAggregator.AGGREGATORS[aggregator]
+                )
+        aggregated = pd.DataFrame(columns).reset_index()
+        if self._resamples:
+            # periods are sorted in chronological order
+            aggregated = aggregated.sort_values(
+                [name for name, _ in self._resamples.values()], kind="stable"
+            )
+        return aggregated
+
+    def _get_key(self, df: pd.DataFrame, dimension: str) -> str | pd.Series:
+        if dimension in self._resamples:
+            name, resolution = self._resamples[dimension]
+            return DataResampler.resample(df[dimension], resolution).rename(name)
+        if dimension not in self._groups:
+            return dimension
+        name, top = self._groups[dimension]
+        return DataAggregator.bucket(df[dimension], top).rename(name)
+
+    @staticmethod
+    def rank(
+        df: pd.DataFrame, dimension: str, measure: str, aggregator: str, top_n: int
+    ) -> tuple:
+        if measure == DataAggregator.COUNT:
+            values = df.groupby(dimension, observed=True).size()
+        else:
+            column = df[measure]
+            if column.dtype == np.float32:
+                column = column.astype("float64")
+            values = column.groupby(df[dimension], observed=True).agg(
+                DataAggregator.AGGREGATORS[aggregator]
+            )
+        return tuple(values.nlargest(top_n).index)
+
+    @staticmethod
+    def bucket(column: pd.Series, top: tuple) -> pd.Series:
+        if not isinstance(column.dtype, CategoricalDtype):
+            return column.where(column.isin(top), DataAggregator.OTHER)
+        # only the categories are remapped, the codes are looked up at once
+        categories = list(dict.fromkeys([*top, DataAggregator.OTHER]))
+        positions = {category: index for index, category in enumerate(categories)}
+        other = positions[DataAggregator.OTHER]
+        # missing values have the code -1, which maps to the last item
+        lookup = np.array(
+            [positions.get(category, other) for category in column.cat.categories]
+            + [other]
+        )
+        codes = lookup[column.cat.codes.to_numpy()]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, pd.Index(categories)),
+            index=column.index,
+            name=column.name,
+        )
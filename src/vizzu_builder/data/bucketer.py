@@ -0,0 +1,123 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+
+import pandas as pd
+
+from .aggregator import DataAggregator
+from .configurator import DataConfig
+from .parser import DataParser
+from ..chart.configurator import SelectedChartConfig
+from ..config.unset import UNSET
+
+
+@dataclass(frozen=True)
+class Bucket:
+    name: str
+    dimension: str
+    measure: str
+    aggregator: str
+    top_n: int
+    top: tuple
+
+
+class DataBucketer:
+    def __init__(self, data: DataConfig, config: SelectedChartConfig) -> None:
+        self._buckets: dict[str, Bucket] = {}
+        if config.top_n and config.dimensions and config.measures:
+            self._set_buckets(data, config)
+        names = {bucket.dimension: bucket.name for bucket in self._buckets.values()}
+        self._config = config.rename(names)
+
+    @property
+    def buckets(self) -> dict[str, Bucket]:
+        return self._buckets
+
+    @property
+    def config(self) -> SelectedChartConfig:
+        # the chart config with the bucketed dimensions renamed
+        return self._config
+
+    @property
+    def groups(self) -> dict[str, tuple[str, tuple]]:
+        return {
+            bucket.dimension: (bucket.name, bucket.top)
+            for bucket in self._buckets.values()
+        }
+
+    def _set_buckets(self, data: DataConfig, config: SelectedChartConfig) -> None:
+        measure = config.measures[0]
+        aggregator = config.aggregators[0]
+        for dimension in config.dimensions:
+            if data.stats.get(dimension).nunique <= config.top_n:
+                continue
+            if config.resolution != UNSET and dimension in data.schema.datetimes:
+                # resampled dates are bounded by their periods
+                continue
+            # categories are ranked on the whole dataset, so the story and the
+            # generated code rank them the same way
+            key = (
+                "top",
+                data.fingerprint,
+                dimension,
+                measure,
+                aggregator,
+                config.top_n,
+            )
+            top = DataParser.CACHE.get(key)
+            if top is None:
+                top = DataAggregator.rank(
+                    data.df, dimension, measure, aggregator, config.top_n
+                )
+                DataParser.CACHE.set(key, top)
+            name = DataBucketer._get_name(dimension, measure, aggregator, config.top_n)
+            self._buckets[name] = Bucket(
+                name=name,
+                dimension=dimension,
+                measure=measure,
+                aggregator=aggregator,
+                top_n=config.top_n,
+                top=top,
+            )
+
+    @staticmethod
+    def _get_name(dimension: str, measure: str, aggregator: str, top_n: int) -> str:
+        if measure == DataAggregator.COUNT:
+            measure = measure.lower()
+        elif aggregator not in [UNSET, "Sum"]:
+            measure = f"{aggregator.lower()}({measure})"
+        return f"{dimension} (Top {top_n} by {measure})"
+
+    @staticmethod
+    def apply(df: pd.DataFrame, buckets: list[Bucket]) -> pd.DataFrame:
+        if not buckets:
+            return df
+        return df.assign(
+            **{
+                bucket.name: DataAggregator.bucket(df[bucket.dimension], bucket.top)
+                for bucket in buckets
+            }
+        )
+
+    @staticmethod
+    def get_code(buckets: list[Bucket]) -> list[str]:
+        code = []
+        for bucket in buckets:
+            dimension = json.dumps(bucket.dimension)
+            if bucket.measure == DataAggregator.COUNT:
+                values = f"df.groupby({dimension}).size()"
+            else:
+                aggregator = DataAggregator.AGGREGATORS[bucket.aggregator]
+                values = (
+                    f"df.groupby({dimension})[{json.dumps(bucket.measure)}]"
+                    f'.agg("{aggregator}")'
+                )
+            code.append(f"top = {values}.nlargest({bucket.top_n}).index")
+            code.append(
+                f"df[{json.dumps(bucket.name)}] = df[{dimension}]"
+                f'.where(df[{dimension}].isin(top), "{DataAggregator.OTHER}")'
+            )
+        return code
@@ -0,0 +1,98 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from pathlib import Path
+import sys
+import threading
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from .stats import DataStats
+
+
+class DataCache:
+    MAX_BYTES: int = 512 * 1024 * 1024
+    CHUNK_SIZE: int = 1024 * 1024
+    MAX_HASHES: int = 256
+
+    _hashes: OrderedDict[Hashable, str] = OrderedDict()
+    _hashes_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._items: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        # streamlit runs every session in its own thread
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = DataCache.get_size(value)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+            while self._items and self._bytes + size > self._max_bytes:
+                self._bytes -= self._items.popitem(last=False)[1][1]
+            self._items[key] = (value, size)
+            self._bytes += size
+
+    def discard(self, match: Callable[[Hashable, Any], bool]) -> None:
+        with self._lock:
+            for key in [
+                key for key, item in self._items.items() if match(key, item[0])
+            ]:
+                self._bytes -= self._items.pop(key)[1]
+
+    @staticmethod
+    def get_size(value: Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True, deep=True))
+        if isinstance(value, DataStats):
+            # the stats keep their frame alive, so it counts against the budget
+            return DataCache.get_size(value.df)
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def get_hash(file: Path) -> str:
+        # files are hashed again only when they change, not on every rerun
+        if isinstance(file, Path):
+            stat = file.stat()
+            key: Hashable = (str(file), stat.st_mtime_ns, stat.st_size)
+        else:
+            key = (file.file_id, file.size)
+        with DataCache._hashes_lock:
+            digest = DataCache._hashes.get(key)
+        if digest is None:
+            digest = DataCache._get_hash(file)
+            with DataCache._hashes_lock:
+                DataCache._hashes[key] = digest
+                while len(DataCache._hashes) > DataCache.MAX_HASHES:
+                    DataCache._hashes.popitem(last=False)
+        return digest
+
+    @staticmethod
+    def _get_hash(file: Path) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(file, Path):
+            with file.open("rb") as stream:
+                while chunk := stream.read(DataCache.CHUNK_SIZE):
+                    digest.update(chunk)
+        else:
+            # uploaded files are in-memory byte streams
+            with file.getbuffer() as buffer:
+                digest.update(buffer)
+        return digest.hexdigest()
@@ -0,0 +1,59 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    CategoricalDtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+
+class DataCompactor:
+    MAX_INTEGER: int = 2**53
+
+    @staticmethod
+    def compact(df: pd.DataFrame) -> pd.DataFrame:
+        # dimensions are stored as categoricals, measures in the smallest dtype
+        # that holds every value exactly
+        df = df.copy(deep=False)
+        for column_name in df.columns:
+            column = df[column_name]
+            if is_integer_dtype(column.dtype) or is_float_dtype(column.dtype):
+                df[column_name] = DataCompactor._downcast(column)
+            elif is_object_dtype(column.dtype) or is_string_dtype(column.dtype):
+                df[column_name] = column.astype("category")
+        return df
+
+    @staticmethod
+    def expand(df: pd.DataFrame) -> pd.DataFrame:
+        # ipyvizzu fills missing dimension values in place, which categoricals
+        # do not allow
+        categoricals = [
+            column_name
+            for column_name in df.columns
+            if isinstance(df[column_name].dtype, CategoricalDtype)
+        ]
+        if not categoricals:
+            return df
+        return df.astype({column_name: object for column_name in categoricals})
+
+    @staticmethod
+    def _downcast(column: pd.Series) -> pd.Series:
+        if is_integer_dtype(column.dtype):
+            return pd.to_numeric(column, downcast="integer")
+        values = column.to_numpy()
+        if (
+            not np.isnan(values).any()
+            and (np.abs(values) < DataCompactor.MAX_INTEGER).all()
+            and (values % 1 == 0).all()
+        ):
+            return pd.to_numeric(column.astype(np.int64), downcast="integer")
+        downcast = column.astype(np.float32)
+        if np.array_equal(downcast.to_numpy(), values, equal_nan=True):
+            return downcast
+        return column
@@ -8,16 +8,32 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
-from .loader import CsvFileUploader
+from .loader import CsvFileUploader, ImportOptions
 from .parser import DataParser
+from .schema import DataSchema
+from .stats import DataStats
 from .filter import DataFilter
 
 
 @dataclass
 class DataConfig:
+    # pylint: disable=too-many-instance-attributes
+
     df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    schema: DataSchema = field(default_factory=DataSchema)
+    stats: DataStats = field(default_factory=lambda: DataStats(pd.DataFrame()))
     filters: str | None = None
+    filter_columns: list[str] = field(default_factory=list)
+    filtered_df: pd.DataFrame = field(default_factory=pd.DataFrame)
     csv_file: Path | None = None
+    options: ImportOptions = field(default_factory=ImportOptions)
+    fingerprint: str = ""
+    source: str = ""
+
+    def get_columns(self, columns: list[str]) -> list[str]:
+        # the referenced columns together with the filtered ones, in file order
+        referenced = set(columns) | set(self.filter_columns)
+        return [str(column) for column in self.df.columns if column in referenced]
 
 
 class DataConfigurator:
@@ -40,11 +56,18 @@ class DataConfigurator:
     def _add_loader(self) -> None:
         csv_file_uploader = CsvFileUploader()
         self._data.csv_file = csv_file_uploader.csv_file
+        self._data.options = csv_file_uploader.options
 
     def _add_parser(self) -> None:
-        parser = DataParser(self._data.csv_file)
+        parser = DataParser(self._data.csv_file, self._data.options)
         self._data.df = parser.df
+        self._data.schema = parser.schema
+        self._data.stats = parser.stats
+        self._data.fingerprint = parser.fingerprint
+        self._data.source = parser.source
 
     def _add_filter(self) -> None:
-        data_filter = DataFilter(self._data.df)
+        data_filter = DataFilter(self._data.df, self._data.stats, self._data.schema)
         self._data.filters = data_filter.filters
+        self._data.filter_columns = data_filter.columns
+        self._data.filtered_df = data_filter.df
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 from pandas.api.types import (
@@ -11,17 +12,24 @@ from pandas.api.types import (
 )
 from streamlit_extras.row import row  # type: ignore
 
+from .schema import DataSchema
+from .stats import DataStats
+
 
 class DataFilter:
     # pylint: disable=too-few-public-methods
 
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(self, df: pd.DataFrame, stats: DataStats, schema: DataSchema) -> None:
         self._filters: list[str] = []
+        self._columns: list[str] = []
+        self._masks: list[pd.Series] = []
+        self._df = df
+        self._stats = stats
+        self._schema = schema
 
         if df.empty:
             return
 
-        self._df = df.copy()
         with st.container():
             self._set_filters()
 
@@ -30,30 +38,49 @@ class DataFilter:
         filters_wrapped = [f"({_f})" for _f in self._filters]
         return " && ".join(filters_wrapped) if filters_wrapped else None
 
+    @property
+    def columns(self) -> list[str]:
+        return self._columns
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if not self._masks:
+            return self._df
+        mask = np.logical_and.reduce([_m.to_numpy() for _m in self._masks])
+        filtered_df: pd.DataFrame = self._df[mask]
+        return filtered_df
+
     def _set_filters(self) -> None:
-        to_filter_columns = st.multiselect(
+        self._columns = st.multiselect(
             "Filter dataframe on (optional)", self._df.columns
         )
         rows = row(2)
-        for column in to_filter_columns:
+        for column in self._columns:
+            stats = self._stats.get(column)
             # Treat columns with < 10 unique values as categorical
-            if (
-                isinstance(self._df[column].dtype, CategoricalDtype)
-                or self._df[column].nunique() < 10
+            # the loaded types decide, compact storage makes every dimension
+            # categorical
+            if stats.nunique < 10 or (
+                self._schema.columns[column].categorical
+                and stats.nunique <= DataStats.MAX_UNIQUES
             ):
                 user_cat_input = rows.multiselect(
                     f"Values for {column}",
-                    self._df[column].unique(),
-                    default=list(self._df[column].unique()),
+                    stats.uniques,
+                    default=stats.uniques,
                 )
+                if len(user_cat_input) == len(stats.uniques) < DataStats.MAX_UNIQUES:
+                    # every value is selected, there is nothing to filter
+                    continue
                 self._filters.append(
                     "||".join(
                         [f"record['{column}'] == '{cat}'" for cat in user_cat_input]
                     )
                 )
+                self._masks.append(self._df[column].isin(user_cat_input))
             elif is_numeric_dtype(self._df[column]):
-                _min = float(self._df[column].min())
-                _max = float(self._df[column].max())
+                _min = float(stats.min)
+                _max = float(stats.max)
                 step = (_max - _min) / 100
                 user_num_input = rows.slider(
                     f"Values for {column}",
@@ -66,21 +93,28 @@ class DataFilter:
                     f"record['{column}'] >= {user_num_input[0]} "
                     f"&& record['{column}'] <= {user_num_input[1]}"
                 )
+                self._masks.append(
+                    self._df[column].between(user_num_input[0], user_num_input[1])
+                )
             elif is_datetime64_any_dtype(self._df[column]):
                 user_date_input = rows.date_input(
                     f"Values for {column}",
-                    value=(
-                        self._df[column].min(),
-                        self._df[column].max(),
-                    ),
+                    value=(stats.min, stats.max),
                 )
                 if len(user_date_input) == 2:
-                    user_date_input = tuple(map(pd.to_datetime, user_date_input))
-                    start_date, end_date = user_date_input
-                    # self._df = self._df.loc[self._df[column].between(start_date, end_date)]
+                    # the whole last day is kept, in the time zone of the column
+                    start_date = pd.Timestamp(user_date_input[0])
+                    end_date = pd.Timestamp(user_date_input[1]) + pd.Timedelta(days=1)
                     self._filters.append(
-                        f"record['{column}'] <= '{end_date}' "
-                        f"&& record['{column}'] >= '{start_date}'"
+                        f"record['{column}'] >= '{start_date:%Y-%m-%d}' "
+                        f"&& record['{column}'] < '{end_date:%Y-%m-%d}'"
+                    )
+                    tz = self._df[column].dt.tz
+                    if tz is not None:
+                        start_date = start_date.tz_localize(tz)
+                        end_date = end_date.tz_localize(tz)
+                    self._masks.append(
+                        (self._df[column] >= start_date) & (self._df[column] < end_date)
                     )
             else:
                 user_text_input = rows.text_input(
@@ -90,8 +124,15 @@ class DataFilter:
                     self._filters.append(
                         f"record['{column}'].includes('{user_text_input}')"
                     )
-                    # self._df = self._df[
-                    #     self._df[column].astype(str).str.contains(user_text_input)
-                    # ]
+                    self._masks.append(self._match(column, user_text_input))
 
                 # raise NotImplementedError("Cannot filter on this column currently")
+
+    def _match(self, column: str, text: str) -> pd.Series:
+        values = self._df[column]
+        if isinstance(values.dtype, CategoricalDtype):
+            # only the categories are searched, not every row
+            categories = values.cat.categories
+            matched = categories[categories.astype(str).str.contains(text, regex=False)]
+            return values.isin(matched)
+        return values.astype(str).str.contains(text, regex=False)
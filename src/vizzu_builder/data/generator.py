@@ -2,26 +2,93 @@
 
 from __future__ import annotations
 
-
+from .bucketer import Bucket, DataBucketer
 from .configurator import DataConfig
+from .reader import DataReader
+from .resampler import DataResampler, Resample
+from .schema import ColumnSchema
 
 
 class DataGenerator:
     # pylint: disable=too-few-public-methods
 
     @staticmethod
-    def get(config: DataConfig) -> list[str]:
+    def get(
+        config: DataConfig,
+        columns: list[str] | None = None,
+        buckets: list[Bucket] | None = None,
+        resamples: list[Resample] | None = None,
+        transformations: list[str] | None = None,
+    ) -> list[str]:
         code: list[str] = []
         if config.csv_file is None or config.df.empty:
             return code
-        d_types = []
-        for column in config.df.columns:
-            if config.df[column].dtype == object:
-                d_types.append(f'"{column}": str')
-            else:
-                d_types.append(f'"{column}": float')
-        code.append(f'd_types={{{", ".join(d_types)}}}')
-        code.append(f'df = pd.read_csv("{config.csv_file.name}", dtype=d_types)')
+        options = config.options
+        if columns is None or len(columns) == len(config.schema.columns):
+            columns = None if options.columns is None else list(options.columns)
+        schema = [
+            column
+            for column in config.schema.columns.values()
+            if columns is None or column.name in columns
+        ]
+        file_format = DataReader.get_format(config.csv_file)
+        if file_format == DataReader.CSV:
+            # dates are parsed by pandas instead of being read as strings
+            d_types = [
+                f'"{column.name}": {"float" if column.measure else "str"}'
+                for column in schema
+                if not column.datetime
+            ]
+            code.append(f'd_types={{{", ".join(d_types)}}}')
+            arguments = ["dtype=d_types"]
+            dates = [column.name for column in schema if column.datetime]
+            if dates:
+                arguments.append(f"parse_dates={dates}")
+            if columns is not None:
+                arguments.append(f"usecols={columns}")
+            if options.row_limit is not None and not options.sample:
+                arguments.append(f"nrows={options.row_limit}")
+            code.append(
+                f'df = pd.read_csv("{config.csv_file.name}", {", ".join(arguments)})'
+            )
+        else:
+            arguments = []
+            if columns is not None:
+                arguments.append(f"columns={columns}")
+            code.append(
+                f'df = pd.read_{file_format}("{config.csv_file.name}"'
+                f'{"".join(f", {argument}" for argument in arguments)})'
+            )
+            if options.row_limit is not None and not options.sample:
+                code.append(f"df = df.head({options.row_limit})")
+            code += DataGenerator._get_conversions(schema)
+        if options.row_limit is not None and options.sample:
+            code.append(
+                "# the app samples the rows chunk by chunk while loading, "
+                "so this sample differs from the rows shown in the app"
+            )
+            code.append(
+                f"df = df.sample(n=min({options.row_limit}, len(df)), "
+                f"random_state={DataReader.RANDOM_STATE})"
+            )
+        code += DataBucketer.get_code(buckets or [])
+        code += DataResampler.get_code(resamples or [])
+        code += transformations or []
         code.append("data = Data()")
         code.append("data.add_df(df)\n")
         return code
+
+    @staticmethod
+    def _get_conversions(schema: list[ColumnSchema]) -> list[str]:
+        # typed files only need the columns whose type was changed
+        code = []
+        for column in schema:
+            if column.measure and not column.numeric:
+                code.append(f'df["{column.name}"] = df["{column.name}"].astype(float)')
+            elif column.datetime:
+                code.append(
+                    f'df["{column.name}"] = pd.to_datetime(df["{column.name}"])'
+                )
+            elif not column.measure and column.numeric:
+                code.append(f'df["{column.name}"] = df["{column.name}"].astype(str)')
+        return code
@@ -2,20 +2,41 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 import streamlit as st
 
+from .reader import DataReader
+
+
+@dataclass(frozen=True)
+class ImportOptions:
+    row_limit: int | None = None
+    sample: bool = False
+    compact: bool = False
+    columns: tuple[str, ...] | None = None
+
 
 class CsvFileUploader:
     # pylint: disable=too-few-public-methods
 
     SAMPLE_FILE: str = "sample/sales.csv"
 
+    ALL_ROWS: str = "All rows"
+    FIRST_ROWS: str = "First rows"
+    SAMPLED_ROWS: str = "Random sample"
+    ROW_LIMIT: int = 100000
+
     def __init__(self) -> None:
         self._csv_file: str | None = None
+        self._row_mode: str = CsvFileUploader.ALL_ROWS
+        self._row_limit: int = CsvFileUploader.ROW_LIMIT
+        self._compact: bool = True
+        self._columns: tuple[str, ...] | None = None
 
         self._add_title()
         self._add_upload_button()
+        self._add_import_options()
 
     @property
     def csv_file(self) -> Path | None:
@@ -25,19 +46,69 @@ class CsvFileUploader:
             return self._csv_file
         return None
 
+    @property
+    def options(self) -> ImportOptions:
+        row_limit = None
+        if self._row_mode != CsvFileUploader.ALL_ROWS:
+            row_limit = self._row_limit
+        return ImportOptions(
+            row_limit=row_limit,
+            sample=self._row_mode == CsvFileUploader.SAMPLED_ROWS,
+            compact=self._compact,
+            columns=self._columns,
+        )
+
     def _add_title(self) -> None:
         st.subheader("Step 1: Upload Data")
 
         st.write(
-            "Upload a CSV under 5MB that you would like to use to build charts and stories, or use "
-            "sample data."
+            "Upload a CSV, Parquet or Feather file that you would like to use to build "
+            "charts and stories, or use sample data. Large files can be limited to some "
+            "of their columns, to their first rows or to a random sample of rows."
         )
 
     def _add_upload_button(self) -> None:
-        self._csv_file = st.file_uploader("Upload a CSV file", type=["csv"])  # type: ignore
+        self._csv_file = st.file_uploader(  # type: ignore
+            "Upload a CSV, Parquet or Feather file",
+            type=[suffix.lstrip(".") for suffix in DataReader.FORMATS],
+        )
         if not self._csv_file:
             self._add_sample_data()
 
     def _add_sample_data(self) -> None:
         if st.toggle("Use sample data"):
             self._csv_file = self.SAMPLE_FILE
+
+    def _add_import_options(self) -> None:
+        if not self._csv_file:
+            return
+        with st.expander("Import options"):
+            col0, col1 = st.columns(2)
+            self._row_mode = col0.selectbox(  # type: ignore
+                "Rows to load",
+                [
+                    CsvFileUploader.ALL_ROWS,
+                    CsvFileUploader.FIRST_ROWS,
+                    CsvFileUploader.SAMPLED_ROWS,
+                ],
+            )
+            self._row_limit = col1.number_input(  # type: ignore
+                "Row limit",
+                min_value=1,
+                value=CsvFileUploader.ROW_LIMIT,
+                step=CsvFileUploader.ROW_LIMIT,
+                disabled=self._row_mode == CsvFileUploader.ALL_ROWS,
+            )
+            columns = DataReader.get_columns(self.csv_file)  # type: ignore
+            selected_columns = st.multiselect(
+                "Columns to load", columns, default=columns
+            )
+            if selected_columns != columns:
+                # keep the file order, the selection order is irrelevant
+                self._columns = tuple(
+                    column for column in columns if column in selected_columns
+                )
+            self._compact = st.toggle(
+                "Compact storage (categorical dimensions, downcast values)",
+                value=True,
+            )
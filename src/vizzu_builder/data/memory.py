@@ -0,0 +1,383 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+import time
+from typing import Any
+import weakref
+
+from ipyvizzu.json import RawJavaScript
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from .cache import DataCache
+from .configurator import DataConfig
+from .parser import DataParser
+from .stats import DataStats
+from ..story.configurator import StoryConfig
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    keys: dict[str, int] = field(default_factory=dict)
+    sessions: int = 0
+    unique_bytes: int = 0
+    total_bytes: int = 0
+    spilled_sessions: int = 0
+    spilled_bytes: int = 0
+
+
+@dataclass
+class SessionRecord:
+    last_seen: float
+    objects: dict[str, weakref.ref] = field(default_factory=dict)
+    spilled: bool = False
+    # taken while the data is reloaded or registered by the session itself,
+    # and while it is spilled by another session
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SessionMemory:
+    KEYS: list[str] = ["BuilderData", "BuilderConfig", "BuilderStory"]
+    FRAMES: list[str] = ["df", "filtered_df"]
+    IDLE_SECONDS: int = 15 * 60
+    SPILL_PATH: Path = Path(tempfile.gettempdir()) / "vizzu-builder"
+
+    _sessions: dict[str, SessionRecord] = {}
+    # identical frames are shared between the sessions by their content key
+    _frames: weakref.WeakValueDictionary[
+        str, pd.DataFrame
+    ] = weakref.WeakValueDictionary()
+    _sizes: dict[str, int] = {}
+    _lock: threading.Lock = threading.Lock()
+    # one session at a time writes and removes the spill files
+    _spill_lock: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._session_id: str | None = None
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        self._session_id = ctx.session_id
+        record = SessionMemory._get_record(self._session_id)
+        with record.lock:
+            record.last_seen = time.monotonic()
+            if record.spilled:
+                # the data is loaded back before the session uses it
+                SessionMemory._reload(self._session_id, record)
+                record.spilled = False
+        SessionMemory._spill_idle_sessions(self._session_id)
+
+    def register(self) -> None:
+        # the objects are referenced weakly, closed sessions are not kept alive
+        if self._session_id is None:
+            return
+        record = SessionMemory._get_record(self._session_id)
+        with record.lock:
+            record.last_seen = time.monotonic()
+            record.objects = {
+                key: weakref.ref(st.session_state[key])
+                for key in SessionMemory.KEYS
+                if key in st.session_state
+            }
+            for data in SessionMemory._get_data(record):
+                SessionMemory._intern(data)
+        with SessionMemory._lock:
+            SessionMemory._sizes = {
+                key: size
+                for key, size in SessionMemory._sizes.items()
+                if key in SessionMemory._frames
+            }
+
+    def get_usage(self) -> MemoryUsage:
+        if self._session_id is None:
+            return MemoryUsage()
+        record = SessionMemory._get_record(self._session_id)
+        keys = {
+            key: sum(SessionMemory._get_sizes(value).values())
+            for key, value in SessionMemory._get_objects(record).items()
+        }
+        with SessionMemory._lock:
+            records = list(SessionMemory._sessions.values())
+        unique: dict[str, int] = {}
+        total = 0
+        for other in records:
+            if other.spilled:
+                continue
+            # objects held by several keys of a session are counted once
+            sizes: dict[str, int] = {}
+            for value in SessionMemory._get_objects(other).values():
+                sizes.update(SessionMemory._get_sizes(value))
+            total += sum(sizes.values())
+            unique.update(sizes)
+        return MemoryUsage(
+            keys=keys,
+            sessions=len(records),
+            unique_bytes=sum(unique.values()),
+            total_bytes=total,
+            spilled_sessions=sum(other.spilled for other in records),
+            spilled_bytes=sum(
+                path.stat().st_size for path in SessionMemory._get_files()
+            ),
+        )
+
+    @staticmethod
+    def _get_record(session_id: str) -> SessionRecord:
+        # records are created again if they were collected in the meantime
+        with SessionMemory._lock:
+            return SessionMemory._sessions.setdefault(
+                session_id, SessionRecord(last_seen=time.monotonic())
+            )
+
+    @staticmethod
+    def _get_objects(record: SessionRecord) -> dict[str, Any]:
+        objects = {key: ref() for key, ref in record.objects.items()}
+        return {key: value for key, value in objects.items() if value is not None}
+
+    @staticmethod
+    def _get_sizes(value: Any) -> dict[str, int]:
+        # sizes are keyed by content or identity, so shared objects add up once
+        if isinstance(value, DataConfig):
+            sizes = {
+                SessionMemory._get_key(value, name): SessionMemory._get_size(
+                    value, name
+                )
+                for name in SessionMemory.FRAMES
+            }
+            if value.csv_file is not None and not isinstance(value.csv_file, Path):
+                # uploaded files are kept in memory by streamlit
+                sizes[value.fingerprint] = getattr(value.csv_file, "size", 0)
+            return sizes
+        if isinstance(value, StoryConfig):
+            sizes = {}
+            if value.data is not None:
+                sizes.update(SessionMemory._get_sizes(value.data))
+            payload = SessionMemory._get_payload(value)
+            if payload is not None:
+                sizes[f"payload:{id(payload)}"] = len(payload)
+            sizes[f"html:{id(value.html)}"] = sum(
+                len(html) for html in value.html.values()
+            )
+            return sizes
+        return {f"object:{id(value)}": len(pickle.dumps(value))}
+
+    @staticmethod
+    def _get_key(data: DataConfig, name: str) -> str:
+        # the filters are part of the key, as they select the filtered rows
+        filters = data.filters if name == "filtered_df" else None
+        content = repr((data.fingerprint, filters))
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_size(data: DataConfig, name: str) -> int:
+        key = SessionMemory._get_key(data, name)
+        with SessionMemory._lock:
+            size = SessionMemory._sizes.get(key)
+        if size is None:
+            size = DataCache.get_size(getattr(data, name))
+            with SessionMemory._lock:
+                SessionMemory._sizes[key] = size
+        return size
+
+    @staticmethod
+    def _get_data(record: SessionRecord) -> list[DataConfig]:
+        data: dict[int, DataConfig] = {}
+        for value in SessionMemory._get_objects(record).values():
+            if isinstance(value, StoryConfig):
+                value = value.data
+            if isinstance(value, DataConfig) and value.fingerprint:
+                data[id(value)] = value
+        return list(data.values())
+
+    @staticmethod
+    def _intern(data: DataConfig) -> None:
+        with SessionMemory._lock:
+            for name in SessionMemory.FRAMES:
+                key = SessionMemory._get_key(data, name)
+                frame = SessionMemory._frames.get(key)
+                if frame is None:
+                    SessionMemory._frames[key] = getattr(data, name)
+                elif frame is not getattr(data, name):
+                    setattr(data, name, frame)
+
+    @staticmethod
+    def _spill_idle_sessions(current_id: str) -> None:
+        # pylint: disable=consider-using-with
+        if not SessionMemory._spill_lock.acquire(blocking=False):
+            return
+        try:
+            SessionMemory._spill_sessions(current_id)
+            SessionMemory._remove_unused_files()
+        finally:
+            SessionMemory._spill_lock.release()
+
+    @staticmethod
+    def _collect(now: float) -> None:
+        with SessionMemory._lock:
+            records = list(SessionMemory._sessions.items())
+        for session_id, record in records:
+            closed = record.objects and not SessionMemory._get_objects(record)
+            # sessions which never registered their data are dropped when idle
+            stale = (
+                not record.objects
+                and now - record.last_seen >= SessionMemory.IDLE_SECONDS
+            )
+            if closed or stale:
+                with SessionMemory._lock:
+                    SessionMemory._sessions.pop(session_id, None)
+
+    @staticmethod
+    def _spill_sessions(current_id: str) -> None:
+        now = time.monotonic()
+        SessionMemory._collect(now)
+        with SessionMemory._lock:
+            records = list(SessionMemory._sessions.items())
+        for session_id, record in records:
+            if (
+                session_id == current_id
+                or record.spilled
+                or now - record.last_seen < SessionMemory.IDLE_SECONDS
+            ):
+                continue
+            # a session which is reloading or registering is not spilled
+            if not record.lock.acquire(blocking=False):
+                continue
+            try:
+                if now - record.last_seen >= SessionMemory.IDLE_SECONDS:
+                    record.spilled = SessionMemory._spill(session_id, record)
+            finally:
+                record.lock.release()
+
+    @staticmethod
+    def _spill(session_id: str, record: SessionRecord) -> bool:
+        datas = SessionMemory._get_data(record)
+        stories = [
+            value
+            for value in SessionMemory._get_objects(record).values()
+            if isinstance(value, StoryConfig)
+            and SessionMemory._get_payload(value) is not None
+        ]
+        written: list[Path] = []
+        try:
+            SessionMemory.SPILL_PATH.mkdir(parents=True, exist_ok=True)
+            for data in datas:
+                for name in SessionMemory.FRAMES:
+                    path = SessionMemory._get_path(data, name)
+                    if not path.exists():
+                        # identical frames of several sessions are written once
+                        written.append(path)
+                        getattr(data, name).to_parquet(path)
+            for story in stories:
+                path = SessionMemory.SPILL_PATH / f"{session_id}.js"
+                written.append(path)
+                path.write_text(
+                    SessionMemory._get_payload(story) or "", encoding="utf-8"
+                )
+        except (OSError, ValueError, pa.ArrowException):
+            # the data stays in memory, and the session is tried again later
+            for path in written:
+                path.unlink(missing_ok=True)
+            return False
+        # the data is only dropped once every file is written
+        SessionMemory._evict(
+            record, datas, [SessionMemory._get_payload(story) for story in stories]
+        )
+        for data in datas:
+            for name in SessionMemory.FRAMES:
+                setattr(data, name, pd.DataFrame())
+            data.stats = DataStats(pd.DataFrame())
+        for story in stories:
+            story.html = {}
+            if story.story is not None:
+                story.story["data"] = RawJavaScript(None)
+        return True
+
+    @staticmethod
+    def _evict(
+        record: SessionRecord, datas: list[DataConfig], payloads: list[str | None]
+    ) -> None:
+        # the parse cache would keep the spilled data alive, unless another
+        # session still works on the same file
+        with SessionMemory._lock:
+            others = [
+                other
+                for other in SessionMemory._sessions.values()
+                if other is not record and not other.spilled
+            ]
+        used = {
+            tag
+            for other in others
+            for data in SessionMemory._get_data(other)
+            for tag in (data.source, data.fingerprint)
+        }
+        tags = {tag for data in datas for tag in (data.source, data.fingerprint)} - used
+        DataParser.CACHE.discard(
+            lambda key, value: (isinstance(key, tuple) and not tags.isdisjoint(key))
+            or any(value is payload for payload in payloads)
+        )
+
+    @staticmethod
+    def _get_payload(story: StoryConfig) -> str | None:
+        if story.story is None or not isinstance(story.story["data"], RawJavaScript):
+            return None
+        payload: str | None = story.story["data"].raw
+        return payload
+
+    @staticmethod
+    def _reload(session_id: str, record: SessionRecord) -> None:
+        for data in SessionMemory._get_data(record):
+            for name in SessionMemory.FRAMES:
+                key = SessionMemory._get_key(data, name)
+                with SessionMemory._lock:
+                    frame = SessionMemory._frames.get(key)
+                if frame is None:
+                    # the file is read without blocking the other sessions
+                    frame = pd.read_parquet(SessionMemory._get_path(data, name))
+                    with SessionMemory._lock:
+                        frame = SessionMemory._frames.setdefault(key, frame)
+                setattr(data, name, frame)
+            data.stats = DataStats(data.df)
+        path = SessionMemory.SPILL_PATH / f"{session_id}.js"
+        for value in SessionMemory._get_objects(record).values():
+            if isinstance(value, StoryConfig) and value.story is not None:
+                if path.exists():
+                    value.story["data"] = RawJavaScript(
+                        path.read_text(encoding="utf-8")
+                    )
+
+    @staticmethod
+    def _get_path(data: DataConfig, name: str) -> Path:
+        key = SessionMemory._get_key(data, name)
+        return SessionMemory.SPILL_PATH / f"{key}.parquet"
+
+    @staticmethod
+    def _get_files() -> list[Path]:
+        if not SessionMemory.SPILL_PATH.exists():
+            return []
+        return [path for path in SessionMemory.SPILL_PATH.iterdir() if path.is_file()]
+
+    @staticmethod
+    def _remove_unused_files() -> None:
+        # files are kept as long as a spilled session refers to them
+        used = set()
+        with SessionMemory._lock:
+            records = list(SessionMemory._sessions.items())
+        for session_id, record in records:
+            if not record.spilled:
+                continue
+            used.add(SessionMemory.SPILL_PATH / f"{session_id}.js")
+            for data in SessionMemory._get_data(record):
+                used.update(
+                    SessionMemory._get_path(data, name) for name in SessionMemory.FRAMES
+                )
+        for path in SessionMemory._get_files():
+            if path not in used:
+                path.unlink(missing_ok=True)
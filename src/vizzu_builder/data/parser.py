@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
+from pandas.api.types import CategoricalDtype
 import streamlit as st
 from streamlit_extras.row import row  # type: ignore
 
-from .loader import CsvFileUploader
+from .cache import DataCache
+from .compact import DataCompactor
+from .loader import CsvFileUploader, ImportOptions
+from .reader import DataReader
+from .schema import DataSchema
+from .stats import DataStats
 
 
 class DataParser:
@@ -19,20 +27,47 @@ class DataParser:
     DIMENSION: str = "Category"
     MEASURE: str = "Value"
 
-    def __init__(self, csv_file: Path | None) -> None:
+    CACHE: DataCache = DataCache()
+
+    def __init__(
+        self, csv_file: Path | None, options: ImportOptions = ImportOptions()
+    ) -> None:
         self._df: pd.DataFrame = pd.DataFrame()
+        self._schema: DataSchema = DataSchema()
+        self._stats: DataStats = DataStats(self._df)
+        self._key: tuple = ()
+        self._read: Callable[[], pd.DataFrame] = pd.DataFrame
+        self._fingerprint: str = ""
+        self._compact = options.compact
 
         if csv_file is None:
             return
 
         self._add_title()
-        self._read_csv_file(csv_file)
+        self._read_file(csv_file, options)
         self._process_df()
 
     @property
     def df(self) -> pd.DataFrame:
         return self._df
 
+    @property
+    def schema(self) -> DataSchema:
+        return self._schema
+
+    @property
+    def stats(self) -> DataStats:
+        return self._stats
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @property
+    def source(self) -> str:
+        # the hash of the file, shared by every parse of its content
+        return str(self._key[0]) if self._key else ""
+
     def _add_title(self) -> None:
         st.subheader("Step 2: Configure Data")
 
@@ -43,11 +78,43 @@ class DataParser:
             """
         )
 
-    def _read_csv_file(self, csv_file: Path) -> None:
+    def _read_file(self, csv_file: Path, options: ImportOptions) -> None:
         dtype = {}
         if csv_file == Path(CsvFileUploader.SAMPLE_FILE):
             dtype = self.SAMPLE_DTYPE
-        self._df = pd.read_csv(csv_file, dtype=dtype)
+        self._key = (
+            DataCache.get_hash(csv_file),
+            tuple(dtype),
+            options.columns,
+            options.row_limit,
+            options.sample,
+            options.compact,
+        )
+        self._read = lambda: DataReader.read(
+            csv_file,
+            dtype,
+            options.columns,
+            options.row_limit,
+            options.sample,
+            options.compact,
+        )
+        self._set_schema(DataReader.get_format(csv_file) != DataReader.CSV)
+
+    def _get_raw_df(self) -> pd.DataFrame:
+        # the loaded frame is only needed until its columns are converted
+        df: pd.DataFrame | None = DataParser.CACHE.get(self._key)
+        if df is None:
+            df = self._read()
+            DataParser.CACHE.set(self._key, df)
+        return df
+
+    def _set_schema(self, typed: bool) -> None:
+        key = ("schema",) + self._key
+        schema = DataParser.CACHE.get(key)
+        if schema is None:
+            schema = DataSchema.infer(self._get_raw_df(), typed)
+            DataParser.CACHE.set(key, schema)
+        self._schema = schema
 
     def _process_df(self) -> None:
         types_container = st.empty()
@@ -57,30 +124,32 @@ class DataParser:
 
     def _add_types(self, types_container) -> None:  # type: ignore
         types = [
-            DataParser.DIMENSION
-            if self._df[col].dtype == object
-            else DataParser.MEASURE
-            for col in self._df.columns
+            DataParser.MEASURE if column.measure else DataParser.DIMENSION
+            for column in self._schema.columns.values()
         ]
-        types_df = pd.DataFrame([types], columns=self._df.columns)
+        types_df = pd.DataFrame([types], columns=list(self._schema.columns))
         types_df = types_df.set_index(pd.Index(["Type"]))
         types_container.write(types_df.head(1))
 
     def _add_type_buttons(self) -> None:
         rows = row(4)
-        column_names = self._df.columns
-        for column_name in column_names:
-            if not self._is_column_convertible_to_float(column_name):
+        selected_types: dict[str, str] = {}
+        for column in self._schema.columns.values():
+            if not column.convertible:
                 continue
-            index = (
-                1 if pd.api.types.is_numeric_dtype(self._df[column_name].dtype) else 0
-            )
             selected_type = rows.selectbox(
-                f"Type for {column_name}",
+                f"Type for {column.name}",
                 [DataParser.DIMENSION, DataParser.MEASURE],
-                index=index,
+                index=1 if column.numeric else 0,
             )
-            self._convert_column(column_name, selected_type)
+            selected_types[column.name] = selected_type
+        self._convert_columns(selected_types)
+        self._schema = self._schema.convert(
+            {
+                column_name: selected_type == DataParser.MEASURE
+                for column_name, selected_type in selected_types.items()
+            }
+        )
 
     def _add_data(self) -> None:
         with st.expander("Show Data"):
@@ -93,15 +162,60 @@ class DataParser:
             )
             st.write(self._df.head(num_rows))
 
-    def _is_column_convertible_to_float(self, column_name: str) -> bool:
-        try:
-            self._df[column_name].astype(float)
-            return True
-        except ValueError:
-            return False
+    def _convert_columns(self, selected_types: dict[str, str]) -> None:
+        key = self._key + tuple(selected_types.items())
+        df = DataParser.CACHE.get(key)
+        if df is None:
+            # cached frames are shared between sessions, never modify them in place
+            self._df = self._get_raw_df().copy(deep=False)
+            for column_name, selected_type in selected_types.items():
+                self._convert_column(column_name, selected_type)
+            for column_name in self._schema.datetimes:
+                # dates are parsed once, so they can be filtered and resampled
+                self._df[column_name] = DataSchema.to_datetime(self._df[column_name])
+            if self._compact:
+                self._df = DataCompactor.compact(self._df)
+            df = self._df
+            DataParser.CACHE.set(key, df)
+            if self._compact:
+                # the compacted frame replaces the loaded one, which is read
+                # again only for other column types
+                DataParser.CACHE.discard(lambda cached, _: cached == self._key)
+        self._df = df
+        # identifies the file content together with the selected column types
+        self._fingerprint = hashlib.blake2b(
+            repr(key).encode(), digest_size=16
+        ).hexdigest()
+        self._set_stats(key)
+
+    def _set_stats(self, key: tuple) -> None:
+        stats_key = ("stats",) + key
+        stats = DataParser.CACHE.get(stats_key)
+        if stats is None:
+            # column statistics are computed lazily and kept with the dataset
+            stats = DataStats(self._df)
+            DataParser.CACHE.set(stats_key, stats)
+        self._stats = stats
 
     def _convert_column(self, column_name: str, selected_type: str) -> None:
         if selected_type == DataParser.DIMENSION:
-            self._df[column_name] = self._df[column_name].astype(str)
-        else:
+            self._df[column_name] = DataParser._to_text(self._df[column_name])
+        elif not pd.api.types.is_numeric_dtype(self._df[column_name].dtype):
+            # numeric columns keep their downcast dtype
             self._df[column_name] = self._df[column_name].astype(float)
+
+    @staticmethod
+    def _to_text(column: pd.Series) -> pd.Series:
+        if not isinstance(column.dtype, CategoricalDtype):
+            return column.astype(str)
+        # only the categories are converted, missing values are shown as in text
+        # columns
+        categories = column.cat.categories.astype(str)
+        if not categories.is_unique:
+            return column.astype(str)
+        column = column.cat.rename_categories(categories)
+        if column.isna().any():
+            if "nan" not in categories:
+                column = column.cat.add_categories("nan")
+            column = column.fillna("nan")
+        return column
@@ -0,0 +1,94 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from ipyvizzu import Data
+from ipyvizzu.data.converters.defaults import NAN_DIMENSION, NAN_MEASURE
+from ipyvizzu.json import RawJavaScript
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+from .parser import DataParser
+
+
+class DataPayload(Data):
+    # a serialization cache: the records are encoded once per frame on the
+    # server, but every chart is a separate component and still receives its
+    # own copy, so the transferred bytes do not shrink
+    def __init__(self, df: pd.DataFrame) -> None:
+        super().__init__()
+        key = ("serialized", DataPayload.get_hash(df))
+        payload = DataParser.CACHE.get(key)
+        if payload is None:
+            payload = DataPayload._serialize(df)
+            DataParser.CACHE.set(key, payload)
+        self._payload: str = payload
+
+    def build(self) -> dict:
+        # the cached serialization is embedded as is into every chart
+        return {"data": RawJavaScript(self._payload)}
+
+    @staticmethod
+    def get_hash(df: pd.DataFrame) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([str(column) for column in df.columns]).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def to_json(df: pd.DataFrame) -> str:
+        # columnar records, dimensions are decoded by the story export
+        return json.dumps({"series": DataPayload._encode(df)}, separators=(",", ":"))
+
+    @staticmethod
+    def _serialize(df: pd.DataFrame) -> str:
+        series = []
+        for column in DataPayload._encode(df):
+            name = json.dumps(column["name"])
+            if column["type"] == "measure":
+                series.append(
+                    f'{{"name":{name},"type":"measure",'
+                    f'"values":{json.dumps(column["values"])}}}'
+                )
+            else:
+                # dimensions are sent as a dictionary and decoded in the browser
+                values = (
+                    f"((d, v) => v.map(i => d[i]))("
+                    f'{json.dumps(column["categories"])}, {json.dumps(column["codes"])})'
+                )
+                series.append(f'{{"name":{name},"type":"dimension","values":{values}}}')
+        return f'{{"series":[{",".join(series)}]}}'
+
+    @staticmethod
+    def _encode(df: pd.DataFrame) -> list[dict]:
+        series: list[dict] = []
+        for column_name in df.columns:
+            column = df[column_name]
+            name = str(column_name)
+            if is_numeric_dtype(column.dtype):
+                values = column.fillna(NAN_MEASURE).astype(float).to_numpy().tolist()
+                series.append({"name": name, "type": "measure", "values": values})
+            else:
+                # categorical columns are factorized from their codes
+                codes, uniques = pd.factorize(column)
+                if is_datetime64_any_dtype(column.dtype):
+                    # dates are formatted like ipyvizzu does in the generated code
+                    categories = pd.Index(uniques).astype(str).tolist()
+                else:
+                    categories = [str(category) for category in uniques]
+                if (codes == -1).any():
+                    codes = np.where(codes == -1, len(categories), codes)
+                    categories.append(NAN_DIMENSION)
+                series.append(
+                    {
+                        "name": name,
+                        "type": "dimension",
+                        "categories": categories,
+                        "codes": codes.tolist(),
+                    }
+                )
+        return series
@@ -0,0 +1,281 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, BinaryIO, ContextManager
+
+import pandas as pd
+from pandas.api.types import (
+    CategoricalDtype,
+    infer_dtype,
+    is_float_dtype,
+    is_object_dtype,
+    is_string_dtype,
+    union_categoricals,
+)
+import pyarrow as pa  # type: ignore
+from pyarrow import feather, parquet
+import streamlit as st
+
+
+class DataReader:
+    CSV: str = "csv"
+    PARQUET: str = "parquet"
+    FEATHER: str = "feather"
+
+    FORMATS: dict[str, str] = {
+        ".csv": CSV,
+        ".parquet": PARQUET,
+        ".pq": PARQUET,
+        ".feather": FEATHER,
+        ".arrow": FEATHER,
+        ".ipc": FEATHER,
+    }
+
+    CHUNK_SIZE: int = 100000
+    RANDOM_STATE: int = 42
+
+    @staticmethod
+    def get_format(file: Path) -> str:
+        return DataReader.FORMATS.get(Path(file.name).suffix.lower(), DataReader.CSV)
+
+    @staticmethod
+    def get_columns(file: Path) -> list[str]:
+        file_format = DataReader.get_format(file)
+        if file_format == DataReader.PARQUET:
+            return list(parquet.read_schema(DataReader._get_source(file)).names)
+        if file_format == DataReader.FEATHER:
+            with pa.ipc.open_file(DataReader._get_source(file)) as reader:
+                return list(reader.schema.names)
+        with DataReader._open(file) as stream:
+            return [str(column) for column in pd.read_csv(stream, nrows=0).columns]
+
+    @staticmethod
+    def read(
+        file: Path,
+        dtype: dict,
+        columns: tuple[str, ...] | None,
+        row_limit: int | None,
+        sample: bool,
+        compact: bool = False,
+    ) -> pd.DataFrame:
+        # pylint: disable=too-many-arguments
+        file_format = DataReader.get_format(file)
+        if file_format == DataReader.PARQUET:
+            df = DataReader._read_parquet(file, columns, row_limit, sample)
+        elif file_format == DataReader.FEATHER:
+            df = DataReader._read_feather(file, columns, row_limit, sample)
+        else:
+            return DataReader._read_csv(
+                file, dtype, columns, row_limit, sample, compact
+            )
+        return DataReader._downcast(df)
+
+    @staticmethod
+    def _read_csv(
+        file: Path,
+        dtype: dict,
+        columns: tuple[str, ...] | None,
+        row_limit: int | None,
+        sample: bool,
+        compact: bool,
+    ) -> pd.DataFrame:
+        # pylint: disable=too-many-arguments,too-many-locals
+        progress = st.progress(0.0, text="Loading data")
+        chunks: list[pd.DataFrame] = []
+        row_number = 0
+        frac = 1.0
+        with DataReader._open(file) as stream:
+            size = max(DataReader._get_size(file), 1)
+            reader = pd.read_csv(
+                stream,
+                dtype=dtype,
+                usecols=None if columns is None else list(columns),
+                chunksize=DataReader.CHUNK_SIZE,
+            )
+            for index, chunk in enumerate(reader):
+                if sample and row_limit is not None:
+                    if index == 0:
+                        # the total row number is estimated from the first chunk
+                        frac = min(1.0, row_limit * stream.tell() / (len(chunk) * size))
+                    chunk = chunk.sample(
+                        frac=frac, random_state=DataReader.RANDOM_STATE
+                    )
+                chunks.append(DataReader._compact_chunk(chunk, compact))
+                row_number += len(chunk)
+                progress.progress(
+                    min(stream.tell() / size, 1.0),
+                    text=f"Loading data ({row_number:,} rows)",
+                )
+                if not sample and row_limit is not None and row_number >= row_limit:
+                    break
+        progress.empty()
+        if not chunks:
+            return pd.DataFrame()
+        DataReader._merge_types(chunks, compact)
+        df = pd.concat(chunks, ignore_index=True)
+        return df if row_limit is None else df.head(row_limit)
+
+    @staticmethod
+    def _compact_chunk(chunk: pd.DataFrame, compact: bool) -> pd.DataFrame:
+        # text columns are stored as categoricals while reading, so the loaded
+        # strings are only held one chunk at a time
+        for column_name in chunk.columns:
+            column = chunk[column_name]
+            if not DataReader._is_text(column):
+                continue
+            if infer_dtype(column, skipna=True).startswith("mixed"):
+                # the parser inferred different types within the chunk
+                column = DataReader._to_text(column)
+            chunk[column_name] = column.astype("category") if compact else column
+        return DataReader._downcast(chunk)
+
+    @staticmethod
+    def _merge_types(chunks: list[pd.DataFrame], compact: bool) -> None:
+        for column_name in chunks[0].columns:
+            columns = [chunk[column_name] for chunk in chunks]
+            kinds = {DataReader._get_kind(column) for column in columns}
+            if len(kinds) > 1:
+                # the chunks inferred different types, only the affected column
+                # of the chunks already read is converted to text
+                for chunk, column in zip(chunks, columns):
+                    if not DataReader._is_text(column):
+                        column = DataReader._to_text(column)
+                        chunk[column_name] = (
+                            column.astype("category") if compact else column
+                        )
+            if compact and len(chunks) > 1:
+                DataReader._merge_categories(chunks, column_name)
+
+    @staticmethod
+    def _merge_categories(chunks: list[pd.DataFrame], column_name: str) -> None:
+        columns = [chunk[column_name] for chunk in chunks]
+        if not all(isinstance(column.dtype, CategoricalDtype) for column in columns):
+            return
+        # chunks with different categories would be concatenated as objects
+        categories = union_categoricals(columns).categories
+        for chunk, column in zip(chunks, columns):
+            chunk[column_name] = column.cat.set_categories(categories)
+
+    @staticmethod
+    def _get_kind(column: pd.Series) -> str:
+        if DataReader._is_text(column):
+            return "text"
+        # integer and float chunks are concatenated as floats
+        return "number" if column.dtype.kind in "iuf" else column.dtype.kind
+
+    @staticmethod
+    def _is_text(column: pd.Series) -> bool:
+        return (
+            is_object_dtype(column.dtype)
+            or is_string_dtype(column.dtype)
+            or isinstance(column.dtype, CategoricalDtype)
+        )
+
+    @staticmethod
+    def _to_text(column: pd.Series) -> pd.Series:
+        if is_float_dtype(column.dtype) and (column.dropna() % 1 == 0).all():
+            # integers are read as floats when the chunk has missing values
+            column = column.astype("Int64")
+        return column.astype(str).where(column.notna())
+
+    @staticmethod
+    def _read_parquet(
+        file: Path,
+        columns: tuple[str, ...] | None,
+        row_limit: int | None,
+        sample: bool,
+    ) -> pd.DataFrame:
+        progress = st.progress(0.0, text="Loading data")
+        parquet_file = parquet.ParquetFile(
+            DataReader._get_source(file), memory_map=True
+        )
+        num_rows = max(parquet_file.metadata.num_rows, 1)
+        frac = 1.0
+        if sample and row_limit is not None:
+            # the total row number is known from the file metadata
+            frac = min(1.0, row_limit / num_rows)
+        tables: list[pa.Table] = []
+        row_number = 0
+        for index in range(parquet_file.num_row_groups):
+            # only the projected columns of a row group are decoded
+            table = parquet_file.read_row_group(
+                index, columns=None if columns is None else list(columns)
+            )
+            row_number += table.num_rows
+            if frac < 1.0:
+                table = DataReader._sample(table, frac)
+            tables.append(table)
+            progress.progress(
+                min(row_number / num_rows, 1.0),
+                text=f"Loading data ({row_number:,} rows)",
+            )
+            if not sample and row_limit is not None and row_number >= row_limit:
+                break
+        progress.empty()
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        return DataReader._to_pandas(pa.concat_tables(tables), row_limit)
+
+    @staticmethod
+    def _read_feather(
+        file: Path,
+        columns: tuple[str, ...] | None,
+        row_limit: int | None,
+        sample: bool,
+    ) -> pd.DataFrame:
+        # uncompressed files are memory-mapped and read without copying
+        table = feather.read_table(
+            DataReader._get_source(file),
+            columns=None if columns is None else list(columns),
+            memory_map=True,
+        )
+        if sample and row_limit is not None and table.num_rows > row_limit:
+            table = DataReader._sample(table, row_limit / table.num_rows)
+        return DataReader._to_pandas(table, row_limit)
+
+    @staticmethod
+    def _sample(table: pa.Table, frac: float) -> pa.Table:
+        indices = (
+            pd.RangeIndex(table.num_rows)
+            .to_series()
+            .sample(frac=frac, random_state=DataReader.RANDOM_STATE)
+            .sort_values()
+        )
+        return table.take(pa.array(indices.to_numpy()))
+
+    @staticmethod
+    def _to_pandas(table: pa.Table, row_limit: int | None) -> pd.DataFrame:
+        if row_limit is not None:
+            table = table.slice(0, row_limit)
+        df: pd.DataFrame = table.to_pandas(split_blocks=True, self_destruct=True)
+        return df
+
+    @staticmethod
+    def _get_source(file: Path) -> Any:
+        if isinstance(file, Path):
+            return str(file)
+        # uploaded files are in-memory byte streams, read without copying
+        return pa.BufferReader(pa.py_buffer(file.getbuffer()))
+
+    @staticmethod
+    def _open(file: Path) -> ContextManager[BinaryIO]:
+        if isinstance(file, Path):
+            return file.open("rb")
+        # uploaded files are in-memory byte streams
+        file.seek(0)
+        return nullcontext(file)
+
+    @staticmethod
+    def _get_size(file: Path) -> int:
+        if isinstance(file, Path):
+            return file.stat().st_size
+        return int(file.size)
+
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        for column_name in df.select_dtypes(include="integer").columns:
+            df[column_name] = pd.to_numeric(df[column_name], downcast="integer")
+        return df
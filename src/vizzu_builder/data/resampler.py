@@ -0,0 +1,127 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+
+import pandas as pd
+
+from .configurator import DataConfig
+from ..chart.configurator import SelectedChartConfig
+from ..config.unset import UNSET
+
+
+@dataclass(frozen=True)
+class Resample:
+    name: str
+    dimension: str
+    resolution: str
+
+
+class DataResampler:
+    # resolution: period frequency and the format of its first day
+    RESOLUTIONS: dict[str, tuple[str, str]] = {
+        "Day": ("D", "%Y-%m-%d"),
+        "Week": ("W", "%Y-%m-%d"),
+        "Month": ("M", "%Y-%m"),
+        "Quarter": ("Q", "%YQ%q"),
+        "Year": ("Y", "%Y"),
+    }
+
+    def __init__(self, data: DataConfig, config: SelectedChartConfig) -> None:
+        self._data = data
+        self._resamples: dict[str, Resample] = {}
+        if config.resolution != UNSET:
+            for dimension in config.dimensions:
+                if dimension in data.schema.datetimes:
+                    name = f"{dimension} ({config.resolution})"
+                    self._resamples[name] = Resample(
+                        name=name, dimension=dimension, resolution=config.resolution
+                    )
+        names = {
+            resample.dimension: resample.name for resample in self._resamples.values()
+        }
+        self._config = config.rename(names)
+
+    @property
+    def resamples(self) -> dict[str, Resample]:
+        return self._resamples
+
+    @property
+    def config(self) -> SelectedChartConfig:
+        # the chart config with the resampled dimensions renamed
+        return self._config
+
+    @property
+    def groups(self) -> dict[str, tuple[str, str]]:
+        return {
+            resample.dimension: (resample.name, resample.resolution)
+            for resample in self._resamples.values()
+        }
+
+    def get_cardinality(self, resample: Resample) -> int:
+        # the number of periods between the first and the last date
+        stats = self._data.stats.get(resample.dimension)
+        if pd.isna(stats.min) or pd.isna(stats.max):
+            return 1
+        frequency, _ = DataResampler.RESOLUTIONS[resample.resolution]
+        return len(
+            pd.period_range(
+                DataResampler._to_naive(stats.min),
+                DataResampler._to_naive(stats.max),
+                freq=frequency,
+            )
+        )
+
+    @staticmethod
+    def resample(column: pd.Series, resolution: str) -> pd.Series:
+        frequency, date_format = DataResampler.RESOLUTIONS[resolution]
+        if column.dt.tz is not None:
+            column = column.dt.tz_localize(None)
+        # only the periods are formatted, the rows keep their codes, and the
+        # sorted categories keep the periods in chronological order
+        periods = column.dt.to_period(frequency).dt.asfreq("D", how="S")
+        codes, uniques = pd.factorize(periods, sort=True)  # type: ignore
+        categories = pd.Series(uniques).dt.strftime(date_format)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, pd.Index(categories)),
+            index=column.index,
+            name=column.name,
+        )
+
+    @staticmethod
+    def apply(df: pd.DataFrame, resamples: list[Resample]) -> pd.DataFrame:
+        if not resamples:
+            return df
+        df = df.assign(
+            **{
+                resample.name: DataResampler.resample(
+                    df[resample.dimension], resample.resolution
+                )
+                for resample in resamples
+            }
+        )
+        # rows are ordered by time, so the periods appear in order in the charts
+        return df.sort_values([resample.name for resample in resamples], kind="stable")
+
+    @staticmethod
+    def get_code(resamples: list[Resample]) -> list[str]:
+        code = []
+        for resample in resamples:
+            frequency, date_format = DataResampler.RESOLUTIONS[resample.resolution]
+            code.append(
+                f"df[{json.dumps(resample.name)}] = df[{json.dumps(resample.dimension)}]"
+                f'.dt.to_period("{frequency}").dt.asfreq("D", how="start")'
+                f'.dt.strftime("{date_format}")'
+            )
+        if resamples:
+            names = [resample.name for resample in resamples]
+            code.append(f'df = df.sort_values({json.dumps(names)}, kind="stable")')
+        return code
+
+    @staticmethod
+    def _to_naive(timestamp: pd.Timestamp) -> pd.Timestamp:
+        if timestamp.tz is None:
+            return timestamp
+        return timestamp.tz_localize(None)
@@ -0,0 +1,129 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import ClassVar
+
+import pandas as pd
+from pandas.api.types import (
+    CategoricalDtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+)
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    # pylint: disable=too-many-instance-attributes
+
+    name: str
+    measure: bool
+    convertible: bool
+    numeric: bool
+    cardinality: int
+    null_count: int
+    min: float | None = None
+    max: float | None = None
+    datetime: bool = False
+    # categorical in the loaded file, not because of compact storage
+    categorical: bool = False
+
+
+@dataclass(frozen=True)
+class DataSchema:
+    SAMPLE_SIZE: ClassVar[int] = 1000
+    DATE_PATTERN: ClassVar[str] = r"^\s*\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}"
+
+    columns: dict[str, ColumnSchema] = field(default_factory=dict)
+
+    @property
+    def dimensions(self) -> list[str]:
+        return [name for name, column in self.columns.items() if not column.measure]
+
+    @property
+    def measures(self) -> list[str]:
+        return [name for name, column in self.columns.items() if column.measure]
+
+    @property
+    def datetimes(self) -> list[str]:
+        return [name for name, column in self.columns.items() if column.datetime]
+
+    def convert(self, measures: dict[str, bool]) -> DataSchema:
+        columns = dict(self.columns)
+        for name, measure in measures.items():
+            columns[name] = replace(columns[name], measure=measure)
+        return DataSchema(columns=columns)
+
+    @staticmethod
+    def infer(df: pd.DataFrame, typed: bool = True) -> DataSchema:
+        # text files are read into categoricals too, only typed files keep them
+        return DataSchema(
+            columns={
+                column_name: DataSchema._infer_column(df[column_name], typed)
+                for column_name in df.columns
+            }
+        )
+
+    @staticmethod
+    def _infer_column(column: pd.Series, typed: bool) -> ColumnSchema:
+        null_count = int(column.isna().sum())
+        if is_datetime64_any_dtype(column.dtype) or DataSchema._is_datetime(
+            column, null_count
+        ):
+            return ColumnSchema(
+                name=str(column.name),
+                measure=False,
+                convertible=False,
+                numeric=False,
+                cardinality=int(column.nunique()),
+                null_count=null_count,
+                datetime=True,
+            )
+        numeric = is_numeric_dtype(column.dtype)
+        values = column if numeric else DataSchema._to_numeric(column, null_count)
+        return ColumnSchema(
+            name=str(column.name),
+            measure=numeric,
+            convertible=values is not None,
+            numeric=numeric,
+            cardinality=int(column.nunique()),
+            null_count=null_count,
+            min=None if values is None else float(values.min()),
+            max=None if values is None else float(values.max()),
+            categorical=typed and isinstance(column.dtype, CategoricalDtype),
+        )
+
+    @staticmethod
+    def _is_datetime(column: pd.Series, null_count: int) -> bool:
+        # only full dates are detected, years and numbers stay as they are
+        if is_numeric_dtype(column.dtype):
+            return False
+        sample = column.head(DataSchema.SAMPLE_SIZE).dropna().astype(str)
+        if sample.empty or not sample.str.match(DataSchema.DATE_PATTERN).all():
+            return False
+        values = DataSchema.to_datetime(column)
+        return values is not None and int(values.isna().sum()) == null_count
+
+    @staticmethod
+    def to_datetime(column: pd.Series) -> pd.Series | None:
+        if is_datetime64_any_dtype(column.dtype):
+            return column
+        try:
+            values = pd.to_datetime(column, errors="coerce")
+        except (TypeError, ValueError):
+            return None
+        if not is_datetime64_any_dtype(values.dtype):
+            return None
+        return values
+
+    @staticmethod
+    def _to_numeric(column: pd.Series, null_count: int) -> pd.Series | None:
+        # a bounded sample can only reject a column, accepting it needs a full pass
+        sample = column.head(DataSchema.SAMPLE_SIZE).dropna()
+        if pd.to_numeric(sample, errors="coerce").isna().any():
+            return None
+        values = pd.to_numeric(column, errors="coerce")
+        if int(values.isna().sum()) != null_count:
+            return None
+        return values
@@ -0,0 +1,52 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    nunique: int
+    uniques: list = field(default_factory=list)
+    min: Any = None
+    max: Any = None
+
+
+class DataStats:
+    # pylint: disable=too-few-public-methods
+
+    MAX_UNIQUES: int = 1000
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+        self._columns: dict[str, ColumnStats] = {}
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    def get(self, column_name: str) -> ColumnStats:
+        if column_name not in self._columns:
+            self._columns[column_name] = DataStats._get_column_stats(
+                self._df[column_name]
+            )
+        return self._columns[column_name]
+
+    @staticmethod
+    def _get_column_stats(column: pd.Series) -> ColumnStats:
+        uniques = pd.unique(column)
+        nunique = len(uniques) - int(pd.isna(uniques).any())
+        _min, _max = None, None
+        if is_numeric_dtype(column.dtype) or is_datetime64_any_dtype(column.dtype):
+            _min, _max = column.min(), column.max()
+        return ColumnStats(
+            nunique=nunique,
+            uniques=list(uniques[: DataStats.MAX_UNIQUES]),
+            min=_min,
+            max=_max,
+        )
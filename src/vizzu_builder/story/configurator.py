@@ -6,12 +6,69 @@ from dataclasses import dataclass, field
 
 from ipyvizzustory.env.st.story import Story
 
+from ..data.bucketer import Bucket
 from ..data.configurator import DataConfig
+from ..data.resampler import Resample
+from .slide import StorySerializer, StorySlide
 
 
 @dataclass
 class StoryConfig:
+    # pylint: disable=too-many-instance-attributes
     data: DataConfig | None = None
     colors: dict[str, int] = field(default_factory=lambda: {})
-    code: list[str] = field(default_factory=list)
+    slides: list[StorySlide] = field(default_factory=list)
+    slide_id: int = 0
     story: Story | None = None
+    columns: list[str] = field(default_factory=list)
+    buckets: dict[str, Bucket] = field(default_factory=dict)
+    resamples: dict[str, Resample] = field(default_factory=dict)
+    series: list[str] = field(default_factory=list)
+    measures: dict[str, list[str]] = field(default_factory=dict)
+    filter_columns: list[str] = field(default_factory=list)
+    aggregate: bool = False
+    rows: int = 0
+    version: int = 0
+    html: dict[tuple, str | bytes] = field(default_factory=dict)
+
+    def reset(self, data: DataConfig) -> None:
+        # the story is created again with the first slide
+        self.data = data
+        self.colors = {}
+        self.slides = []
+        self.story = None
+        self.columns = []
+        self.buckets = {}
+        self.resamples = {}
+        self.series = []
+        self.measures = {}
+        self.filter_columns = []
+        self.rows = 0
+        self.version += 1
+
+    def get_slide_id(self) -> int:
+        # slide ids are never reused, so widgets keep following their slide
+        self.slide_id += 1
+        return self.slide_id
+
+    def insert_slide(self, index: int, slide: StorySlide) -> None:
+        self.slides.insert(index, slide)
+        self._set_slides()
+
+    def delete_slide(self, index: int) -> None:
+        del self.slides[index]
+        self._set_slides()
+
+    def move_slide(self, index: int, new_index: int) -> None:
+        self.slides.insert(new_index, self.slides.pop(index))
+        self._set_slides()
+
+    def set_story(self, story: Story) -> None:
+        self.story = story
+        self.story["slides"] = StorySerializer.get_slides(self.slides)
+
+    def _set_slides(self) -> None:
+        # the slides are assembled from their cached blocks
+        if self.story is not None:
+            self.set_story(self.story)
+        self.version += 1
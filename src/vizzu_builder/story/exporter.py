@@ -0,0 +1,96 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import base64
+import gzip
+import io
+import zipfile
+
+from ipyvizzu.json import RawJavaScript
+from ipyvizzustory.env.st.story import Story
+import pandas as pd
+
+from ..data.payload import DataPayload
+
+
+class StoryExporter:
+    HTML: str = "HTML"
+    COMPRESSED: str = "Compressed HTML"
+    BUNDLE: str = "HTML with data file (zip)"
+    FORMATS: list[str] = [HTML, COMPRESSED, BUNDLE]
+
+    HTML_FILE: str = "story.html"
+    DATA_FILE: str = "story.json.gz"
+    BUNDLE_FILE: str = "story.zip"
+
+    PLAYER: str = "vp.slides = vizzuPlayerData;"
+    # the compressed series are fetched, decompressed and decoded in the browser
+    LOADER: str = """fetch("{source}")
+                    .then(response => new Response(
+                        response.body.pipeThrough(new DecompressionStream("gzip"))
+                    ).json())
+                    .then(data => {{
+                        vizzuPlayerData.data = {{series: data.series.map(series =>
+                            series.codes === undefined ? series : {{
+                                name: series.name,
+                                type: series.type,
+                                values: series.codes.map(i => series.categories[i]),
+                            }}
+                        )}};
+                        vp.slides = vizzuPlayerData;
+                    }});"""
+
+    @staticmethod
+    def get_mime(export_format: str) -> str:
+        if export_format == StoryExporter.BUNDLE:
+            return "application/zip"
+        return "text/html"
+
+    @staticmethod
+    def get_file_name(export_format: str) -> str:
+        if export_format == StoryExporter.BUNDLE:
+            return StoryExporter.BUNDLE_FILE
+        return StoryExporter.HTML_FILE
+
+    @staticmethod
+    def export(
+        story: Story, export_format: str, df: pd.DataFrame | None = None
+    ) -> str | bytes:
+        if export_format == StoryExporter.HTML:
+            return story.to_html()
+        if df is None:
+            raise ValueError("the compressed exports need the story data")
+        data = StoryExporter.compress(df)
+        if export_format == StoryExporter.COMPRESSED:
+            # the data stays in the file, so the story still opens offline
+            source = (
+                "data:application/gzip;base64,"
+                f"{base64.b64encode(data).decode('ascii')}"
+            )
+            return StoryExporter.get_html(story, source)
+        html = StoryExporter.get_html(story, StoryExporter.DATA_FILE)
+        bundle = io.BytesIO()
+        with zipfile.ZipFile(bundle, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr(StoryExporter.HTML_FILE, html)
+            archive.writestr(StoryExporter.DATA_FILE, data)
+        return bundle.getvalue()
+
+    @staticmethod
+    def compress(df: pd.DataFrame) -> bytes:
+        return gzip.compress(DataPayload.to_json(df).encode(), mtime=0)
+
+    @staticmethod
+    def get_html(story: Story, source: str) -> str:
+        data = story["data"]
+        # the data is left out of the player and loaded by the loader
+        story["data"] = RawJavaScript("null")
+        try:
+            html: str = story.to_html()
+        finally:
+            story["data"] = data
+        if StoryExporter.PLAYER not in html:
+            raise ValueError("the story player does not support loading data")
+        return html.replace(
+            StoryExporter.PLAYER, StoryExporter.LOADER.format(source=source)
+        )
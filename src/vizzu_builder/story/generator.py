@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-import black
+import pandas as pd
 import streamlit as st
 from streamlit_extras.row import row  # type: ignore
 from ipyvizzustory.env.st.story import Story
-from ipyvizzustory import Slide, Step
-from streamlit_vizzu import Config, Data, Style  # type: ignore
+from streamlit_vizzu import Data  # type: ignore
 
 from ..chart.configurator import SelectedChartConfig
+from ..config.formatter import CodeFormatter
 from ..config.presets import Preset
+from ..data.bucketer import DataBucketer
 from ..data.configurator import DataConfig
 from ..data.generator import DataGenerator
+from ..data.payload import DataPayload
+from ..data.resampler import DataResampler
 from .configurator import StoryConfig
+from .exporter import StoryExporter
+from .optimizer import StoryOptimizer
+from .slide import StorySerializer, StorySlide
 
 
 class StoryGenerator:
@@ -32,17 +38,8 @@ class StoryGenerator:
         if not self._data.df.empty:
             if self._story.data.df.empty:
                 self._story.data = self._data
-            if self._story.story is None or not self._story.data.df.equals(
-                self._data.df
-            ):
-                self._story.data = self._data
-                self._story.colors = {}
-                data = Data()
-                data.add_df(self._data.df)
-                self._story.story = Story(data=data)
-                self.set_size(self.SIZE[0], self.SIZE[1])
-                self.set_start_slide(self.START_SLIDE)
-                self._story.code = []
+            if self._story.data.fingerprint != self._data.fingerprint:
+                self._story.reset(self._data)
 
     @property
     def story(self) -> StoryConfig:
@@ -55,75 +52,264 @@ class StoryGenerator:
         self._story.story.set_size(width, height)
 
     def add_slide(self, preset: Preset) -> None:
-        filters = self._data.filters
-        self._story.story.add_slide(
-            Slide(
-                Step(Data.filter(filters), Config(preset.config), Style(preset.style))
-            )
+        config = self._get_config()
+        bucketer = DataBucketer(self._data, config)
+        resampler = DataResampler(self._data, bucketer.config)
+        slide = StorySlide(
+            slide_id=self._story.get_slide_id(),
+            chart=preset.chart,
+            filters=self._data.filters,
+            config=preset.config,
+            style=preset.style,
+            columns=tuple(self._data.get_columns(config.columns)),
+            series=tuple(
+                dict.fromkeys(resampler.config.columns + self._data.filter_columns)
+            ),
+            measures=tuple(zip(config.measures, config.aggregators)),
+            filter_columns=tuple(self._data.filter_columns),
+            buckets=tuple(bucketer.buckets.values()),
+            resamples=tuple(resampler.resamples.values()),
+        )
+        self._story.insert_slide(len(self._story.slides), slide)
+        self._set_data()
+
+    def _set_data(self) -> None:
+        # the story data is the union of the data of its slides
+        story = self._story
+        columns = {column for slide in story.slides for column in slide.columns}
+        measures: dict[str, list[str]] = {}
+        for slide in story.slides:
+            for measure, aggregator in slide.measures:
+                if aggregator not in measures.setdefault(measure, []):
+                    measures[measure].append(aggregator)
+        state = (
+            [str(column) for column in self._data.df.columns if column in columns],
+            {bucket.name: bucket for slide in story.slides for bucket in slide.buckets},
+            {
+                resample.name: resample
+                for slide in story.slides
+                for resample in slide.resamples
+            },
+            list(
+                dict.fromkeys(
+                    series for slide in story.slides for series in slide.series
+                )
+            ),
+            measures,
+            list(
+                dict.fromkeys(
+                    column for slide in story.slides for column in slide.filter_columns
+                )
+            ),
+        )
+        if story.story is not None and state == (
+            story.columns,
+            story.buckets,
+            story.resamples,
+            story.series,
+            story.measures,
+            story.filter_columns,
+        ):
+            return
+        (
+            story.columns,
+            story.buckets,
+            story.resamples,
+            story.series,
+            story.measures,
+            story.filter_columns,
+        ) = state
+        if story.slides:
+            self._update_data()
+
+    def _update_data(self) -> None:
+        df = self._get_df()
+        # dimensions are embedded as dictionaries, like the data of the charts
+        payload = DataPayload(df)
+        story = self._story.story
+        if story is None:
+            # the placeholder data is replaced by the payload
+            story = Story(data=Data.filter(None))
+            self._story.set_story(story)
+            self.set_size(self.SIZE[0], self.SIZE[1])
+            self.set_start_slide(self.START_SLIDE)
+        story.update(payload.build())
+        self._story.rows = len(df)
+
+    def _get_df(self) -> pd.DataFrame:
+        df = DataBucketer.apply(
+            self._data.df[self._story.columns], list(self._story.buckets.values())
         )
-        filters = f'"{filters}"' if filters else None
-        animation = (
-            f"Data.filter({filters}), Config({preset.config}), Style({preset.style})"
+        df = DataResampler.apply(df, list(self._story.resamples.values()))
+        # the story only carries the series referenced by its slides
+        df = df[self._get_series()]
+        aggregations = self._get_aggregations()
+        if aggregations is not None:
+            df = StoryOptimizer.aggregate(df, aggregations)
+        return df
+
+    def _get_series(self) -> list[str]:
+        derived = set(self._story.buckets) | set(self._story.resamples)
+        return [
+            series
+            for series in self._story.series
+            if series in self._story.columns or series in derived
+        ]
+
+    def _get_aggregations(self) -> dict[str, str] | None:
+        if not self._story.aggregate:
+            return None
+        return StoryOptimizer.get_aggregations(
+            self._story.measures, self._story.filter_columns
         )
-        self._story.code.append(f"story.add_slide(Slide(Step({animation})))")
 
     def play(self) -> None:
-        if self._story.story is not None and self._story.story["slides"]:
+        if self._story.story is not None and self._story.slides:
             width_template = (
                 '<div style="width:{}%;display:inline-block;box-sizing:border-box;">'
             )
             mid_width = 70
             left_width = (100 - mid_width) / 2
             left = f"{width_template.format(left_width)}</div>"
-            mid = self._story.story.to_html().strip()
+            st.subheader("Story")
+            self._add_aggregate_button()
+            self._story.story.set_feature("tooltip", self._get_tooltip())
+            mid = str(self._get_html(self.SIZE, self.START_SLIDE)).strip()
             if mid.startswith("<div>"):
                 mid = mid.replace(
                     "<div>", f"{width_template.format(mid_width)}<div>", 1
                 )
-            st.subheader("Story")
-            self._story.story.set_feature("tooltip", self._get_tooltip())
             st.components.v1.html("".join([left, mid]), height=500)
+            self._add_slide_buttons()
             rows = row(2)
-            self._add_delete_button(rows)
             self._add_download_button(rows)
             self._add_show_code_button()
 
+    def _add_aggregate_button(self) -> None:
+        aggregate = st.toggle(
+            "Pre-aggregate story data",
+            value=self._story.aggregate,
+            help="The story embeds one row per category combination of its slides.",
+        )
+        if aggregate != self._story.aggregate:
+            self._story.aggregate = aggregate
+            self._update_data()
+            self._story.version += 1
+        if aggregate and self._get_aggregations() is None:
+            st.caption(
+                "Counts, means and filtered values need every row, "
+                "so the story data is not aggregated."
+            )
+        st.caption(
+            f"The story embeds {self._story.rows:,} rows of "
+            f"{len(self._get_series())} columns."
+        )
+
+    def _get_config(self) -> SelectedChartConfig:
+        return st.session_state.get("BuilderConfig", SelectedChartConfig())
+
     def _get_tooltip(self) -> bool:
-        return st.session_state.get("BuilderConfig", SelectedChartConfig()).tooltip  # type: ignore
+        return self._get_config().tooltip
 
-    def _add_delete_button(self, rows) -> None:  # type: ignore
-        if self._story.story is not None and self._story.story["slides"]:
-            rows.button(
-                "Delete Last Slide",
-                use_container_width=True,
-                on_click=self._delete_last_slide,
-            )
+    def _add_slide_buttons(self) -> None:
+        slides = self._story.slides
+        rows = row([3, 1, 1, 1], vertical_align="bottom")
+        labels = [f"{index + 1}. {slide.chart}" for index, slide in enumerate(slides)]
+        index = labels.index(rows.selectbox("Slide", labels, index=len(labels) - 1))
+        rows.button(
+            "Move Up",
+            use_container_width=True,
+            disabled=index == 0,
+            on_click=self._move_slide,
+            args=(index, index - 1),
+        )
+        rows.button(
+            "Move Down",
+            use_container_width=True,
+            disabled=index == len(slides) - 1,
+            on_click=self._move_slide,
+            args=(index, index + 1),
+        )
+        rows.button(
+            "Delete Slide",
+            use_container_width=True,
+            on_click=self._delete_slide,
+            args=(index,),
+        )
 
-    def _delete_last_slide(self) -> None:
-        if (
-            self._story.story is not None
-            and self._story.story["slides"]
-            and self._story.code
-        ):
-            self._story.story["slides"].pop()
-            self._story.code.pop()
+    def _move_slide(self, index: int, new_index: int) -> None:
+        if 0 <= new_index < len(self._story.slides):
+            self._story.move_slide(index, new_index)
+
+    def _delete_slide(self, index: int) -> None:
+        if 0 <= index < len(self._story.slides):
+            self._story.delete_slide(index)
+            self._set_data()
 
     def _add_download_button(self, rows) -> None:  # type: ignore
         if self._story.story is not None:
-            self.set_size(self.HTML_SIZE[0], self.HTML_SIZE[1])
-            self.set_start_slide(self.HTML_START_SLIDE)
+            export_format = rows.selectbox(
+                "Export format",
+                StoryExporter.FORMATS,
+                label_visibility="collapsed",
+                help="Compressed stories decompress their data in the browser.",
+            )
+            key = self._get_html_key(
+                self.HTML_SIZE, self.HTML_START_SLIDE, export_format
+            )
+            if key not in self._story.html:
+                # the downloadable story is only rendered on request
+                rows.button(
+                    "Prepare Download",
+                    use_container_width=True,
+                    on_click=self._get_html,
+                    args=(self.HTML_SIZE, self.HTML_START_SLIDE, export_format),
+                )
+                return
             rows.download_button(
                 label="Download Story",
-                data=self._story.story.to_html(),
-                file_name="story.html",
-                mime="text/html",
+                data=self._story.html[key],
+                file_name=StoryExporter.get_file_name(export_format),
+                mime=StoryExporter.get_mime(export_format),
                 use_container_width=True,
             )
-            self.set_size(self.SIZE[0], self.SIZE[1])
-            self.set_start_slide(self.START_SLIDE)
+
+    def _get_html_key(
+        self, size: tuple, start_slide: int, export_format: str = StoryExporter.HTML
+    ) -> tuple:
+        return (
+            self._story.version,
+            self._data.fingerprint,
+            size,
+            start_slide,
+            self._get_tooltip(),
+            export_format,
+        )
+
+    def _get_html(
+        self, size: tuple, start_slide: int, export_format: str = StoryExporter.HTML
+    ) -> str | bytes:
+        key = self._get_html_key(size, start_slide, export_format)
+        if key not in self._story.html:
+            df = None if export_format == StoryExporter.HTML else self._get_df()
+            self.set_size(size[0], size[1])
+            self.set_start_slide(start_slide)
+            try:
+                html = StoryExporter.export(self._story.story, export_format, df)
+            finally:
+                self.set_size(self.SIZE[0], self.SIZE[1])
+                self.set_start_slide(self.START_SLIDE)
+            # only the html of the current story version is kept
+            self._story.html = {
+                _key: _html
+                for _key, _html in self._story.html.items()
+                if _key[0] == self._story.version
+            }
+            self._story.html[key] = html
+        return self._story.html[key]  # type: ignore
 
     def _add_show_code_button(self) -> None:
-        if self._story.story is not None and self._story.code:
+        if self._story.story is not None and self._story.slides:
             show_code = st.expander("Show Code")
             with show_code:
                 st.code(
@@ -132,16 +318,30 @@ class StoryGenerator:
                 )
 
     def _get_code(self) -> str:
-        if self._story.story is not None and self._story.code:
+        if self._story.story is not None and self._story.slides:
             code = []
             code.append("import pandas as pd")
             code.append("from ipyvizzu import Config, Data, Style")
             code.append("from ipyvizzustory import Story, Slide, Step")
-            code += DataGenerator.get(self._data)
+            aggregations = self._get_aggregations()
+            code += DataGenerator.get(
+                self._data,
+                self._story.columns,
+                list(self._story.buckets.values()),
+                list(self._story.resamples.values()),
+                (
+                    []
+                    if aggregations is None
+                    else StoryOptimizer.get_code(self._get_series(), aggregations)
+                ),
+            )
             code.append("story = Story(data)")
             code.append(f"story.set_size({self.PYTHON_SIZE[0]}, {self.PYTHON_SIZE[1]})")
             code.append(f'story.set_feature("tooltip", {self._get_tooltip()})\n')
-            unformatted_code = "\n".join(code + self._story.code + ["\nstory.play()"])
-            formatted_code = black.format_str(unformatted_code, mode=black.FileMode())
-            return formatted_code
+            # every part is formatted and cached on its own, so adding a slide
+            # only formats the new slide
+            formatted_code = [CodeFormatter.format("\n".join(code))]
+            formatted_code.append(StorySerializer.get_code(self._story.slides))
+            formatted_code.append(CodeFormatter.format("story.play()"))
+            return "\n".join(formatted_code)
         return ""
@@ -0,0 +1,70 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from ..data.aggregator import DataAggregator
+
+
+class StoryOptimizer:
+    # aggregators whose results stay the same when the aggregated rows are
+    # aggregated again by fewer categories in the slides
+    AGGREGATORS: dict[str, str] = {
+        aggregator: function
+        for aggregator, function in DataAggregator.AGGREGATORS.items()
+        if function != "mean"
+    }
+
+    @staticmethod
+    def get_aggregations(
+        measures: dict[str, list[str]], filter_columns: list[str]
+    ) -> dict[str, str] | None:
+        # counts, means and filtered values need the rows of the slides
+        aggregations: dict[str, str] = {}
+        for measure, aggregators in measures.items():
+            if measure == DataAggregator.COUNT or measure in filter_columns:
+                return None
+            if any(
+                aggregator not in StoryOptimizer.AGGREGATORS
+                for aggregator in aggregators
+            ):
+                return None
+            functions = {
+                StoryOptimizer.AGGREGATORS[aggregator] for aggregator in aggregators
+            }
+            if len(functions) != 1:
+                return None
+            aggregations[measure] = functions.pop()
+        return aggregations
+
+    @staticmethod
+    def aggregate(df: pd.DataFrame, aggregations: dict[str, str]) -> pd.DataFrame:
+        dimensions = [column for column in df.columns if column not in aggregations]
+        if not dimensions or not aggregations:
+            return df
+        upcast = {
+            measure: "float64"
+            for measure in aggregations
+            if df[measure].dtype == np.float32
+        }
+        if upcast:
+            df = df.astype(upcast)
+        return (
+            df.groupby(dimensions, sort=False, dropna=False, observed=True)
+            .agg(aggregations)
+            .reset_index()
+        )
+
+    @staticmethod
+    def get_code(columns: list[str], aggregations: dict[str, str]) -> list[str]:
+        dimensions = [column for column in columns if column not in aggregations]
+        if not dimensions or not aggregations:
+            return []
+        return [
+            f"df = df.groupby({json.dumps(dimensions)}, sort=False, dropna=False)"
+            f".agg({json.dumps(aggregations)}).reset_index()"
+        ]
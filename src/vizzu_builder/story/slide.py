@@ -0,0 +1,117 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property
+import json
+
+from ipyvizzu.json import RawJavaScript, RawJavaScriptEncoder
+from streamlit_vizzu import Data  # type: ignore
+
+from ..config.formatter import CodeFormatter
+from ..data.bucketer import Bucket
+from ..data.resampler import Resample
+
+
+@dataclass(frozen=True)
+class StorySlide:
+    # pylint: disable=too-many-instance-attributes
+
+    slide_id: int
+    chart: str
+    filters: str | None
+    config: dict
+    style: dict
+    columns: tuple[str, ...] = ()
+    series: tuple[str, ...] = ()
+    measures: tuple[tuple[str, str], ...] = ()
+    filter_columns: tuple[str, ...] = ()
+    buckets: tuple[Bucket, ...] = ()
+    resamples: tuple[Resample, ...] = ()
+
+    # every block is serialized once, the story only assembles them
+
+    @cached_property
+    def filter_json(self) -> str:
+        filters = Data.filter(self.filters)["filter"]
+        return json.dumps(filters, cls=RawJavaScriptEncoder)
+
+    @cached_property
+    def config_json(self) -> str:
+        return json.dumps(self.config)
+
+    @cached_property
+    def style_json(self) -> str:
+        return json.dumps(self.style)
+
+    @cached_property
+    def filter_code(self) -> str:
+        filters = f'"{self.filters}"' if self.filters else None
+        return f"Data.filter({filters})"
+
+    @cached_property
+    def config_code(self) -> str:
+        return f"Config({self.config})"
+
+    @cached_property
+    def style_code(self) -> str:
+        return f"Style({self.style})"
+
+
+class StorySerializer:
+    BLOCKS: list[str] = ["filter", "config", "style"]
+    # shorter blocks are repeated in the code, they are easier to read inline
+    MIN_SHARED_CODE: int = 40
+
+    @staticmethod
+    def get_slides(slides: list[StorySlide]) -> RawJavaScript:
+        # identical blocks are emitted once and referenced by the slides
+        blocks: dict[str, dict[str, int]] = {
+            block: {} for block in StorySerializer.BLOCKS
+        }
+        records = []
+        for slide in slides:
+            references = []
+            for block in StorySerializer.BLOCKS:
+                value = getattr(slide, f"{block}_json")
+                index = blocks[block].setdefault(value, len(blocks[block]))
+                references.append(f'"{block}":{block}s[{index}]')
+            records.append(f"[{{{','.join(references)}}}]")
+        parameters = ", ".join(f"{block}s" for block in StorySerializer.BLOCKS)
+        arguments = ", ".join(
+            f"[{','.join(blocks[block])}]" for block in StorySerializer.BLOCKS
+        )
+        return RawJavaScript(f"(({parameters}) => [{','.join(records)}])({arguments})")
+
+    @staticmethod
+    def get_code(slides: list[StorySlide]) -> str:
+        # blocks used by more than one slide are defined once as variables
+        counts = Counter(
+            getattr(slide, f"{block}_code")
+            for slide in slides
+            for block in StorySerializer.BLOCKS
+        )
+        names: dict[str, str] = {}
+        code = []
+        for block in StorySerializer.BLOCKS:
+            shared = [
+                value
+                for value in dict.fromkeys(
+                    getattr(slide, f"{block}_code") for slide in slides
+                )
+                if counts[value] > 1 and len(value) >= StorySerializer.MIN_SHARED_CODE
+            ]
+            for index, value in enumerate(shared):
+                names[value] = f"{block}{index + 1}"
+                code.append(CodeFormatter.format(f"{names[value]} = {value}"))
+        for slide in slides:
+            step = ", ".join(
+                names.get(value, value)
+                for value in (
+                    getattr(slide, f"{block}_code") for block in StorySerializer.BLOCKS
+                )
+            )
+            code.append(CodeFormatter.format(f"story.add_slide(Slide(Step({step})))"))
+        return "".join(code)
@@ -0,0 +1,16 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import pytest
+
+from src.vizzu_builder.data.cache import DataCache
+from src.vizzu_builder.data.parser import DataParser
+
+
+@pytest.fixture(name="cache", autouse=True)
+def fixture_cache(monkeypatch: pytest.MonkeyPatch) -> DataCache:
+    # the cache is shared by the whole process, every test starts empty
+    cache = DataCache()
+    monkeypatch.setattr(DataParser, "CACHE", cache)
+    return cache
@@ -0,0 +1,95 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.vizzu_builder.chart.configurator import SelectedChartConfig
+from src.vizzu_builder.data.aggregator import DataAggregator
+from src.vizzu_builder.data.configurator import DataConfig
+
+
+@pytest.fixture(name="df")
+def fixture_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Country": pd.Categorical(["A", "B", "A", "C", None]),
+            "Year": ["2020", "2020", "2021", "2021", "2021"],
+            "Value": np.array([0.1, 0.2, 0.3, 0.9, 0.5], dtype=np.float32),
+        }
+    )
+
+
+def get_data(df: pd.DataFrame) -> DataConfig:
+    return DataConfig(df=df, filtered_df=df, fingerprint="test")
+
+
+def test_aggregate(df: pd.DataFrame) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country"],
+        measures=["Value", "Count"],
+        aggregators=["Mean", "Sum"],
+    )
+    aggregator = DataAggregator(get_data(df), config)
+    assert aggregator.aggregated
+    aggregated = aggregator.df.set_index("Country")
+    # downcast measures are aggregated in full precision
+    expected = df.astype({"Value": "float64"}).groupby("Country", observed=True)
+    assert aggregated["Value"].dtype == np.float64
+    assert aggregated.loc["A", "Value"] == expected["Value"].mean()["A"]
+    assert aggregated.loc["A", "Count"] == 2
+    # missing dimension values are kept as a group
+    assert aggregated["Count"].sum() == len(df)
+
+
+def test_aggregate_cached(df: pd.DataFrame) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Year"], measures=["Value"], aggregators=["Sum"]
+    )
+    first = DataAggregator(get_data(df), config)
+    second = DataAggregator(get_data(df.iloc[:0]), config)
+    # the key is the fingerprint, not the frame
+    assert second.df is first.df
+
+
+def test_without_measures(df: pd.DataFrame) -> None:
+    config = SelectedChartConfig(dimensions=["Country"])
+    aggregator = DataAggregator(get_data(df), config)
+    assert not aggregator.aggregated
+    assert aggregator.df is df
+
+
+def test_groups(df: pd.DataFrame) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country"], measures=["Count"], aggregators=["Sum"]
+    )
+    groups = {"Country": ("Country (Top 1)", ("A",))}
+    aggregated = DataAggregator(get_data(df), config, groups=groups).df
+    assert dict(zip(aggregated["Country (Top 1)"], aggregated["Count"])) == {
+        "A": 2,
+        DataAggregator.OTHER: 3,
+    }
+
+
+def test_rank(df: pd.DataFrame) -> None:
+    assert DataAggregator.rank(df, "Country", "Value", "Sum", 2) == ("C", "A")
+    assert DataAggregator.rank(df, "Country", "Count", "Sum", 1) == ("A",)
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_bucket(categorical: bool) -> None:
+    column = pd.Series(["A", "B", None, "C", "A"], name="Country")
+    if categorical:
+        column = column.astype("category")
+    bucketed = DataAggregator.bucket(column, ("A", "C"))
+    # missing values are bucketed together with the other values
+    assert bucketed.astype(object).tolist() == [
+        "A",
+        DataAggregator.OTHER,
+        DataAggregator.OTHER,
+        "C",
+        "A",
+    ]
+    assert bucketed.name == "Country"
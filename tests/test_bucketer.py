@@ -0,0 +1,110 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from src.vizzu_builder.chart.configurator import SelectedChartConfig
+from src.vizzu_builder.data.aggregator import DataAggregator
+from src.vizzu_builder.data.bucketer import DataBucketer
+from src.vizzu_builder.data.configurator import DataConfig
+from src.vizzu_builder.data.resampler import DataResampler
+from src.vizzu_builder.data.schema import DataSchema
+from src.vizzu_builder.data.stats import DataStats
+
+
+@pytest.fixture(name="data")
+def fixture_data() -> DataConfig:
+    df = pd.DataFrame(
+        {
+            "Country": ["A", "B", "C", "A", "D", "B", "A"],
+            "Date": pd.to_datetime(
+                [
+                    "2023-12-30",
+                    "2024-01-02",
+                    "2024-02-15",
+                    "2024-03-31",
+                    "2024-04-01",
+                    "2024-12-31",
+                    "2025-01-01",
+                ]
+            ),
+            "Value": [1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+    return DataConfig(
+        df=df,
+        schema=DataSchema.infer(df),
+        stats=DataStats(df),
+        filtered_df=df,
+        fingerprint="test",
+    )
+
+
+def run_code(df: pd.DataFrame, code: list[str]) -> pd.DataFrame:
+    # the generated code runs on a copy of the data, as in the exported notebook
+    variables = {"df": df.copy()}
+    exec("\n".join(code), {}, variables)  # pylint: disable=exec-used
+    result: pd.DataFrame = variables["df"]
+    return result
+
+
+def test_buckets(data: DataConfig) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country"], measures=["Value"], aggregators=["Sum"], top_n=2
+    )
+    bucketer = DataBucketer(data, config)
+    name = "Country (Top 2 by Value)"
+    assert list(bucketer.buckets) == [name]
+    assert bucketer.groups == {"Country": (name, ("A", "B"))}
+    assert bucketer.config.dimensions == [name]
+    buckets = list(bucketer.buckets.values())
+    applied = DataBucketer.apply(data.df, buckets)
+    generated = run_code(data.df, DataBucketer.get_code(buckets))
+    assert applied[name].tolist() == generated[name].tolist()
+    assert set(applied[name]) == {"A", "B", DataAggregator.OTHER}
+
+
+def test_no_buckets_below_top_n(data: DataConfig) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country"], measures=["Count"], aggregators=["Sum"], top_n=4
+    )
+    bucketer = DataBucketer(data, config)
+    assert not bucketer.buckets
+    assert bucketer.config.dimensions == ["Country"]
+
+
+@pytest.mark.parametrize("resolution", list(DataResampler.RESOLUTIONS))
+def test_resamples(data: DataConfig, resolution: str) -> None:
+    config = SelectedChartConfig(
+        dimensions=["Date", "Country"],
+        measures=["Value"],
+        aggregators=["Sum"],
+        resolution=resolution,
+    )
+    resampler = DataResampler(data, config)
+    name = f"Date ({resolution})"
+    assert resampler.config.dimensions == [name, "Country"]
+    resamples = list(resampler.resamples.values())
+    applied = DataResampler.apply(data.df, resamples)
+    generated = run_code(data.df, DataResampler.get_code(resamples))
+    assert applied[name].astype(str).tolist() == generated[name].tolist()
+    # the periods are in chronological order
+    periods = list(dict.fromkeys(applied[name]))
+    assert periods == sorted(periods)
+    assert len(periods) <= resampler.get_cardinality(resamples[0])
+
+
+def test_resample_formats(data: DataConfig) -> None:
+    column = data.df["Date"]
+    assert DataResampler.resample(column, "Quarter").tolist()[:2] == [
+        "2023Q4",
+        "2024Q1",
+    ]
+    assert DataResampler.resample(column, "Week").tolist()[:2] == [
+        "2023-12-25",
+        "2024-01-01",
+    ]
+    utc = DataResampler.resample(column.dt.tz_localize("UTC"), "Month")
+    assert utc.tolist() == DataResampler.resample(column, "Month").tolist()
@@ -0,0 +1,42 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.vizzu_builder.data.compact import DataCompactor
+
+
+def test_round_trip() -> None:
+    df = pd.DataFrame(
+        {
+            "Country": ["Austria", "Belgium", np.nan, "Austria"],
+            "Year": [2020.0, 2021.0, 2022.0, 2023.0],
+            "Ratio": [0.5, 0.25, np.nan, 1.0],
+            "Price": [0.1, 0.2, 0.3, 0.4],
+            "Id": [2**60, 1, 2, 3],
+        }
+    )
+    compacted = DataCompactor.compact(df)
+    assert isinstance(compacted["Country"].dtype, pd.CategoricalDtype)
+    assert compacted["Year"].dtype == np.int16
+    assert compacted["Ratio"].dtype == np.float32
+    # values which are not exact as float32 keep their dtype
+    assert compacted["Price"].dtype == np.float64
+    assert compacted["Id"].dtype == np.int64
+    expanded = DataCompactor.expand(compacted)
+    assert expanded["Country"].dtype == object
+    pd.testing.assert_frame_equal(expanded, df, check_dtype=False)
+
+
+def test_compact_keeps_the_original() -> None:
+    df = pd.DataFrame({"Country": ["Austria"], "Value": [1.0]})
+    DataCompactor.compact(df)
+    assert df["Country"].dtype == object
+    assert df["Value"].dtype == np.float64
+
+
+def test_expand_without_categoricals() -> None:
+    df = pd.DataFrame({"Value": [1, 2]})
+    assert DataCompactor.expand(df) is df
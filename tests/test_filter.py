@@ -0,0 +1,129 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+from src.vizzu_builder.data import filter as data_filter
+from src.vizzu_builder.data.filter import DataFilter
+from src.vizzu_builder.data.schema import DataSchema
+from src.vizzu_builder.data.stats import DataStats
+
+
+class Row:
+    # the widgets return the given values, or their defaults
+
+    def __init__(self, values: dict[str, Any]) -> None:
+        self._values = values
+
+    def multiselect(self, label: str, options: list, default: list) -> list:
+        # pylint: disable=unused-argument
+        return list(self._values.get(label, default))
+
+    def slider(self, label: str, value: tuple, **_: Any) -> tuple:
+        return tuple(self._values.get(label, value))
+
+    def date_input(self, label: str, value: tuple) -> tuple:
+        return tuple(self._values.get(label, value))
+
+    def text_input(self, label: str) -> str:
+        return str(self._values.get(label, ""))
+
+
+@pytest.fixture(name="df")
+def fixture_df() -> pd.DataFrame:
+    # columns with less than 10 values are always filtered by their values
+    cities = [f"City {chr(ord('A') + i)}" for i in range(12)]
+    return pd.DataFrame(
+        {
+            "Country": ["Austria", "Belgium", "Austria", "Denmark"] * 3,
+            "City": pd.Categorical(cities),
+            "Name": [city.lower() for city in cities],
+            "Value": [float(i + 1) for i in range(12)],
+            "Date": pd.date_range("2024-01-01", periods=12, freq="12h"),
+        }
+    )
+
+
+def get_filter(
+    df: pd.DataFrame,
+    values: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    schema: DataSchema | None = None,
+) -> DataFilter:
+    columns = [label.split(" ")[-1] for label in values]
+    monkeypatch.setattr(st, "multiselect", lambda *_args, **_kwargs: columns)
+    monkeypatch.setattr(data_filter, "row", lambda _: Row(values))
+    return DataFilter(df, DataStats(df), schema or DataSchema.infer(df))
+
+
+def test_categories(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = get_filter(df, {"Values for Country": ["Austria", "Denmark"]}, monkeypatch)
+    assert data.columns == ["Country"]
+    assert data.filters == (
+        "(record['Country'] == 'Austria'||record['Country'] == 'Denmark')"
+    )
+    assert set(data.df["Country"]) == {"Austria", "Denmark"}
+    assert len(data.df) == 9
+
+
+def test_every_category(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = get_filter(
+        df, {"Values for Country": ["Austria", "Belgium", "Denmark"]}, monkeypatch
+    )
+    assert data.filters is None
+    assert data.df is df
+
+
+def test_numbers(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = get_filter(df, {"Values for Value": (2.0, 3.0)}, monkeypatch)
+    assert data.filters == "(record['Value'] >= 2.0 && record['Value'] <= 3.0)"
+    assert data.df["Value"].tolist() == [2.0, 3.0]
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Budapest"])
+def test_dates(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch, tz: str) -> None:
+    df["Date"] = df["Date"].dt.tz_localize(tz)
+    data = get_filter(
+        df, {"Values for Date": (date(2024, 1, 1), date(2024, 1, 2))}, monkeypatch
+    )
+    # the whole last day is kept
+    assert data.filters == (
+        "(record['Date'] >= '2024-01-01' && record['Date'] < '2024-01-03')"
+    )
+    assert data.df["Value"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.parametrize("column,text", [("City", "y B"), ("Name", "y b")])
+def test_text(
+    df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch, column: str, text: str
+) -> None:
+    # text filters are used for categoricals which were not typed in the file
+    schema = DataSchema.infer(df, typed=False)
+    data = get_filter(
+        df, {f"Substring or regex in {column}": text}, monkeypatch, schema
+    )
+    assert data.filters == f"(record['{column}'].includes('{text}'))"
+    assert data.df["Value"].tolist() == [2.0]
+
+
+def test_typed_categories(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = get_filter(df, {"Values for City": ["City C"]}, monkeypatch)
+    assert data.filters == "(record['City'] == 'City C')"
+    assert data.df["Value"].tolist() == [3.0]
+
+
+def test_combined(df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = get_filter(
+        df,
+        {"Values for Country": ["Austria"], "Values for Value": (2.0, 6.0)},
+        monkeypatch,
+    )
+    assert data.filters is not None
+    assert data.filters.count(" && ") == 2
+    assert data.df["Value"].tolist() == [3.0, 5.0]
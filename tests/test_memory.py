@@ -0,0 +1,122 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,protected-access
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+import weakref
+
+import pandas as pd
+import pytest
+
+from src.vizzu_builder.data.cache import DataCache
+from src.vizzu_builder.data.configurator import DataConfig
+from src.vizzu_builder.data.memory import SessionMemory, SessionRecord
+from src.vizzu_builder.data.stats import DataStats
+
+
+@pytest.fixture(name="spill_path")
+def fixture_spill_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(SessionMemory, "SPILL_PATH", tmp_path)
+    monkeypatch.setattr(SessionMemory, "_sessions", {})
+    monkeypatch.setattr(SessionMemory, "_frames", weakref.WeakValueDictionary())
+    monkeypatch.setattr(SessionMemory, "_sizes", {})
+    return tmp_path
+
+
+@pytest.fixture(name="data")
+def fixture_data() -> DataConfig:
+    df = pd.DataFrame(
+        {"Country": pd.Categorical(["A", "B", "A"]), "Value": [1.0, 2.0, 3.0]}
+    )
+    return DataConfig(
+        df=df,
+        stats=DataStats(df),
+        filters="record['Country'] == 'A'",
+        filtered_df=df[df["Country"] == "A"],
+        fingerprint="fingerprint",
+        source="source",
+    )
+
+
+def add_session(session_id: str, data: DataConfig, idle: bool) -> SessionRecord:
+    last_seen = time.monotonic()
+    if idle:
+        last_seen -= SessionMemory.IDLE_SECONDS
+    record = SessionRecord(
+        last_seen=last_seen, objects={"BuilderData": weakref.ref(data)}
+    )
+    SessionMemory._sessions[session_id] = record
+    return record
+
+
+def test_spill_and_reload(spill_path: Path, data: DataConfig, cache: DataCache) -> None:
+    df, filtered_df = data.df, data.filtered_df
+    cache.set(("fingerprint", "Country"), df)
+    record = add_session("idle", data, idle=True)
+    current = add_session("current", DataConfig(), idle=True)
+    SessionMemory._spill_idle_sessions("current")
+    assert record.spilled
+    assert not current.spilled
+    assert data.df.empty and data.filtered_df.empty
+    # the parse cache does not keep the spilled data alive
+    assert cache.get(("fingerprint", "Country")) is None
+    assert len(list(spill_path.glob("*.parquet"))) == 2
+    SessionMemory._reload("idle", record)
+    pd.testing.assert_frame_equal(data.df, df)
+    pd.testing.assert_frame_equal(data.filtered_df, filtered_df)
+    assert data.stats.df is data.df
+
+
+def test_active_session(spill_path: Path, data: DataConfig) -> None:
+    record = add_session("active", data, idle=False)
+    SessionMemory._spill_idle_sessions("current")
+    assert not record.spilled
+    assert not data.df.empty
+    assert not list(spill_path.iterdir())
+
+
+def test_failed_spill(
+    spill_path: Path, data: DataConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def to_parquet(*_args: object, **_kwargs: object) -> None:
+        raise OSError("disk full")
+
+    df = data.df
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", to_parquet)
+    record = add_session("idle", data, idle=True)
+    SessionMemory._spill_idle_sessions("current")
+    # the data stays in memory, and the session is tried again later
+    assert not record.spilled
+    assert data.df is df
+    assert not list(spill_path.iterdir())
+
+
+def test_shared_files(spill_path: Path, data: DataConfig) -> None:
+    other = DataConfig(**vars(data))
+    first = add_session("first", data, idle=True)
+    second = add_session("second", other, idle=True)
+    SessionMemory._spill_idle_sessions("current")
+    assert first.spilled and second.spilled
+    # identical frames are written once
+    assert len(list(spill_path.glob("*.parquet"))) == 2
+    SessionMemory._reload("first", first)
+    first.spilled = False
+    first.last_seen = time.monotonic()
+    SessionMemory._spill_idle_sessions("current")
+    assert not first.spilled
+    # the files are kept while the other session refers to them
+    assert len(list(spill_path.glob("*.parquet"))) == 2
+
+
+@pytest.mark.usefixtures("spill_path")
+def test_collect(data: DataConfig) -> None:
+    closed = DataConfig(**vars(data))
+    add_session("closed", closed, idle=False)
+    add_session("open", data, idle=False)
+    SessionMemory._sessions["stale"] = SessionRecord(
+        last_seen=time.monotonic() - SessionMemory.IDLE_SECONDS
+    )
+    del closed
+    SessionMemory._collect(time.monotonic())
+    assert list(SessionMemory._sessions) == ["open"]
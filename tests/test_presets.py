@@ -0,0 +1,97 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.vizzu_builder.chart.configurator import SelectedChartConfig
+from src.vizzu_builder.config.presets import Presets
+from src.vizzu_builder.config.presets.loader import PresetLoader
+from src.vizzu_builder.config.presets.registry import PresetRegistry
+
+
+def get_series(config: dict) -> set[str]:
+    # pylint: disable=protected-access
+    # the templates get their label channel when the chart is created
+    return {
+        series
+        for channel in Presets.CHANNELS
+        for series in Presets._get_series(config.get(channel))
+    }
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (1, 2), (2, 1), (2, 2)])
+def test_matching_shape(shape: tuple[int, int]) -> None:
+    presets = PresetRegistry.resolve(*shape)
+    assert len(presets) == len(PresetLoader.load(f"d{shape[0]}m{shape[1]}"))
+
+
+@pytest.mark.parametrize("shape", [(3, 1), (3, 2), (4, 1), (2, 3), (4, 4)])
+def test_larger_shape(shape: tuple[int, int]) -> None:
+    dimension_count, measure_count = shape
+    presets = PresetRegistry.resolve(dimension_count, measure_count)
+    assert presets
+    configs = [
+        (json.dumps(preset.template["config"], sort_keys=True), preset.measures)
+        for preset in presets
+    ]
+    assert len(configs) == len(set(configs))
+    dimensions = {
+        f"{PresetLoader.PLACEHOLDER}dimension{index + 1}"
+        for index in range(dimension_count)
+    }
+    for preset in presets:
+        # every selected dimension is shown, so the aggregated data is valid
+        assert dimensions <= get_series(preset.template["config"])
+        assert set(preset.dimensions) == dimensions
+        assert all(index < measure_count for _, index in preset.measures)
+
+
+def test_charts() -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country", "Year", "Product"],
+        measures=["Price", "Count"],
+        aggregators=["Mean", "Sum"],
+    )
+    charts = Presets(config).charts
+    assert len({chart["chart"] for chart in charts}) == len(charts)
+    for chart in charts:
+        series = get_series(chart["config"])
+        assert {"Country", "Year", "Product"} <= series
+        assert series <= {"Country", "Year", "Product", "mean(Price)", "count()"}
+        assert get_series(chart["aggregated_config"]) <= {
+            "Country",
+            "Year",
+            "Product",
+            "Price",
+            "Count",
+        }
+
+
+def test_pruning() -> None:
+    config = SelectedChartConfig(
+        dimensions=["Country", "Year"],
+        measures=["Price"],
+        aggregators=["Sum"],
+        marker_budget=1000,
+    )
+    cardinalities = {"Country": 200, "Year": 10}
+    unranked = Presets(config).charts
+    presets = Presets(config, cardinalities)
+    # every chart shows both dimensions, so none of them fits the budget
+    assert presets.pruned == len(unranked)
+    assert not presets.charts
+    cardinalities = {"Country": 50, "Year": 10}
+    presets = Presets(config, cardinalities)
+    assert presets.pruned == 0
+    crowded = [
+        Presets._is_crowded(  # pylint: disable=protected-access
+            chart["config"], 500, cardinalities
+        )
+        for chart in presets.charts
+    ]
+    # crowded charts are ranked last
+    assert crowded == sorted(crowded)
+    assert any(crowded)
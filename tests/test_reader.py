@@ -0,0 +1,47 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pytest
+
+from src.vizzu_builder.data.compact import DataCompactor
+from src.vizzu_builder.data.reader import DataReader
+
+
+@pytest.fixture(name="csv_file")
+def fixture_csv_file(tmp_path: Path) -> Path:
+    # the codes are numeric in the first chunk and text in the second one
+    codes = [str(10000 + i) for i in range(9)] + [None, "A1000", "B2000", None]
+    csv_file = tmp_path / "codes.csv"
+    pd.DataFrame({"Code": codes, "Value": range(len(codes))}).to_csv(
+        csv_file, index=False
+    )
+    return csv_file
+
+
+def test_type_change_across_chunks(
+    csv_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(DataReader, "CHUNK_SIZE", 10)
+    df = DataReader.read(csv_file, {}, None, None, False)
+    expected = pd.read_csv(csv_file, dtype={"Code": str})
+    pd.testing.assert_series_equal(df["Code"], expected["Code"])
+    assert df["Value"].tolist() == expected["Value"].tolist()
+    pa.Table.from_pandas(DataCompactor.compact(df))
+
+
+def test_categories_across_chunks(
+    csv_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(DataReader, "CHUNK_SIZE", 10)
+    df = DataReader.read(csv_file, {}, None, None, False, compact=True)
+    expected = pd.read_csv(csv_file, dtype={"Code": str})
+    assert isinstance(df["Code"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(
+        df["Code"].astype(object), expected["Code"], check_dtype=False
+    )
+    assert df["Value"].tolist() == expected["Value"].tolist()